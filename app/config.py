@@ -43,10 +43,15 @@ class Settings(BaseSettings):
     neo4j_user: str = "neo4j"
     neo4j_password: str = ""
     neo4j_timeout_ms: int = 2000
+    neo4j_max_retry_time_ms: int = 2000
 
     # ── Timeouts (milliseconds) — Dev A's components only ─
     ai_timeout_ms: int = 10000
 
+    # ── LLM decision cache (0 entries disables it) ───────
+    llm_cache_max_entries: int = 0
+    llm_cache_ttl_s: int = 3600
+
     # ── Game rules ───────────────────────────────────────
     max_turns: int = 30
     max_mood_delta: int = 15
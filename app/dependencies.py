@@ -44,12 +44,22 @@ def get_llm_service() -> LLMService:
             _llm_service = MockLLMService()
         else:
             from app.services.ai_brain import OpenAILLMService
+            from app.services.decision_cache import CachingLLMService
 
             logger.info(
                 "DI: Using OpenAILLMService (real OpenAI)",
-                extra={"step": "dependency_init"},
+                extra={
+                    "step": "dependency_init",
+                    "llm_cache_max_entries": settings.llm_cache_max_entries,
+                },
             )
             _llm_service = OpenAILLMService()
+            if settings.llm_cache_max_entries > 0:
+                _llm_service = CachingLLMService(
+                    _llm_service,
+                    max_entries=settings.llm_cache_max_entries,
+                    ttl_s=settings.llm_cache_ttl_s,
+                )
     return _llm_service
 
 
@@ -4,6 +4,9 @@ Samvad XR — Primary Interface for Developer B.
 This module exposes the ONE function Dev B calls from their pipeline:
     generate_vendor_response()
 
+plus generate_vendor_response_batch() for driving several independent
+sessions at once (load tests, replay harnesses).
+
 Architecture v3.0: Dev B owns the API endpoint. This function is called
 at Step 7 of the pipeline, between Dev B's memory/RAG retrieval and
 Dev B's TTS synthesis.
@@ -20,6 +23,7 @@ Usage by Dev B:
     )
 """
 
+import asyncio
 import logging
 import time
 import uuid
@@ -44,7 +48,7 @@ from app.prompts.vendor_system import (
     build_system_prompt,
     build_user_message,
 )
-from app.services.state_engine import validate_ai_decision
+from app.services.state_engine import make_validator
 
 logger = logging.getLogger("samvadxr")
 
@@ -302,6 +306,7 @@ async def generate_vendor_response(
         ai_decision = await llm.generate_decision(
             system_prompt=system_prompt,
             user_message=user_message,
+            session_id=session_id,
         )
     except BrainServiceError:
         raise
@@ -334,13 +339,10 @@ async def generate_vendor_response(
     # ── 4. Validate via State Engine ───────────────────────
     t0 = time.monotonic()
 
-    validated = validate_ai_decision(
-        ai_decision=ai_decision,
-        session_state=session_state,
-        max_mood_delta=settings.max_mood_delta,
-    )
+    validate = make_validator(settings.max_mood_delta)
+    validated = validate(ai_decision, session_state)
 
-    if validated.warnings:
+    if validated.warnings and logger.isEnabledFor(logging.WARNING):
         logger.warning(
             "State engine overrides applied",
             extra={
@@ -494,3 +496,33 @@ async def generate_vendor_response(
     )
 
     return response.model_dump()
+
+
+async def generate_vendor_response_batch(
+    requests: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Run generate_vendor_response() for several sessions concurrently.
+
+    Each item holds the keyword arguments of one generate_vendor_response()
+    call. All calls are awaited together, so K sessions cost roughly the
+    slowest LLM round-trip instead of the sum of them.
+
+    Args:
+        requests: One kwargs dict per call. Session IDs must be distinct —
+            two turns of the same session would race on load/save.
+
+    Returns:
+        Response dicts in the same order as ``requests``.
+
+    Raises:
+        ValueError: If a session_id appears more than once.
+        BrainServiceError / StateStoreError: The first failure, as in
+            generate_vendor_response().
+    """
+    session_ids = [req["session_id"] for req in requests]
+    if len(set(session_ids)) != len(session_ids):
+        raise ValueError("generate_vendor_response_batch needs distinct session_ids")
+
+    return list(
+        await asyncio.gather(*(generate_vendor_response(**req) for req in requests))
+    )
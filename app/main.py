@@ -33,7 +33,7 @@ from .services.session_store import init_neo4j, close_neo4j
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Startup and shutdown events for the FastAPI application."""
-    settings: Settings = get_settings()
+    settings: Settings = app.state.settings
     setup_logging(settings.log_level)
 
     logger = logging.getLogger("samvadxr")
@@ -62,6 +62,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 user=settings.neo4j_user,
                 password=settings.neo4j_password,
                 timeout_ms=settings.neo4j_timeout_ms,
+                max_retry_time_ms=settings.neo4j_max_retry_time_ms,
             )
             neo4j_connected = True
             logger.info(
@@ -99,9 +100,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 # ---------------------------------------------------------------------------
 
 
-def create_app() -> FastAPI:
-    """Build and return the configured FastAPI application."""
-    settings = get_settings()
+def create_app(settings: Optional[Settings] = None) -> FastAPI:
+    """Build and return the configured FastAPI application.
+
+    Args:
+        settings: Explicit configuration (tests). Defaults to
+            ``get_settings()``, i.e. the environment. Only app construction
+            (CORS, version, whether the dev endpoint exists) and the lifespan
+            (logging, Neo4j startup) honour it. The request path —
+            generate_vendor_response() and the DI singletons in
+            app.dependencies — still reads ``get_settings()``, so the
+            environment must agree on anything those use.
+    """
+    if settings is None:
+        settings = get_settings()
 
     app = FastAPI(
         title="Samvad XR Orchestration — Dev Server",
@@ -113,6 +125,7 @@ def create_app() -> FastAPI:
         version=settings.app_version,
         lifespan=lifespan,
     )
+    app.state.settings = settings
 
     # ── CORS ──────────────────────────────────────────
     origins = [o.strip() for o in settings.cors_origins.split(",")]
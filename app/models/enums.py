@@ -6,6 +6,7 @@ Pydantic validation rejects unknown enum values automatically.
 """
 
 from enum import Enum
+from typing import Final
 
 
 class NegotiationStage(str, Enum):
@@ -17,9 +18,11 @@ class NegotiationStage(str, Enum):
         HAGGLING  → DEAL | WALKAWAY | CLOSURE
         WALKAWAY  → HAGGLING (only if happiness_score > 40) | CLOSURE
 
-    Terminal states: DEAL, CLOSURE
+    Terminal states: DEAL, CLOSURE (each member's ``is_terminal`` flag)
     """
 
+    is_terminal: bool  # set per member below, from TERMINAL_STAGES
+
     GREETING = "GREETING"
     INQUIRY = "INQUIRY"
     HAGGLING = "HAGGLING"
@@ -31,9 +34,9 @@ class NegotiationStage(str, Enum):
 class VendorMood(str, Enum):
     """Categorical mood descriptor returned alongside numeric scores.
 
-    Derived from happiness_score:
-        0-25   → angry
-        26-40  → annoyed
+    Derived from happiness_score (see MOOD_THRESHOLDS):
+        0-20   → angry
+        21-40  → annoyed
         41-60  → neutral
         61-80  → friendly
         81-100 → enthusiastic
@@ -58,27 +61,46 @@ class LanguageCode(str, Enum):
 
 # ── Legal state transitions ──────────────────────────────────
 # Single source of truth — used by state_engine.py
-# Key = current stage, Value = set of valid next stages
-LEGAL_TRANSITIONS: dict[NegotiationStage, set[NegotiationStage]] = {
-    NegotiationStage.GREETING: {NegotiationStage.INQUIRY},
-    NegotiationStage.INQUIRY: {NegotiationStage.HAGGLING, NegotiationStage.WALKAWAY},
-    NegotiationStage.HAGGLING: {
+# Key = current stage, Value = frozenset of valid next stages
+LEGAL_TRANSITIONS: Final[dict[NegotiationStage, frozenset[NegotiationStage]]] = {
+    NegotiationStage.GREETING: frozenset({NegotiationStage.INQUIRY}),
+    NegotiationStage.INQUIRY: frozenset(
+        {NegotiationStage.HAGGLING, NegotiationStage.WALKAWAY}
+    ),
+    NegotiationStage.HAGGLING: frozenset({
         NegotiationStage.DEAL,
         NegotiationStage.WALKAWAY,
         NegotiationStage.CLOSURE,
-    },
-    NegotiationStage.WALKAWAY: {NegotiationStage.HAGGLING, NegotiationStage.CLOSURE},
-    NegotiationStage.DEAL: set(),      # terminal — no transitions out
-    NegotiationStage.CLOSURE: set(),   # terminal — no transitions out
+    }),
+    NegotiationStage.WALKAWAY: frozenset(
+        {NegotiationStage.HAGGLING, NegotiationStage.CLOSURE}
+    ),
+    NegotiationStage.DEAL: frozenset(),      # terminal — no transitions out
+    NegotiationStage.CLOSURE: frozenset(),   # terminal — no transitions out
 }
 
-TERMINAL_STAGES: frozenset[NegotiationStage] = frozenset(
+TERMINAL_STAGES: Final[frozenset[NegotiationStage]] = frozenset(
     {NegotiationStage.DEAL, NegotiationStage.CLOSURE}
 )
 
+# Plain attribute per member so hot paths read a flag instead of hashing
+for _stage in NegotiationStage:
+    _stage.is_terminal = _stage in TERMINAL_STAGES
+del _stage
+
 # ── Numeric constraints ──────────────────────────────────────
-MOOD_MIN: int = 0
-MOOD_MAX: int = 100
-MAX_MOOD_DELTA: int = 15          # per-turn clamp (also in config for override)
-MAX_TURNS: int = 30               # hard limit per session
-WRAP_UP_TURN_THRESHOLD: int = 25  # AI gets wrap-up instruction after this turn
+MOOD_MIN: Final[int] = 0
+MOOD_MAX: Final[int] = 100
+MAX_MOOD_DELTA: Final[int] = 15          # per-turn clamp (also in config for override)
+MAX_TURNS: Final[int] = 30               # hard limit per session
+WRAP_UP_TURN_THRESHOLD: Final[int] = 25  # AI gets wrap-up instruction after this turn
+
+# ── Mood bands ───────────────────────────────────────────────
+# Single source of truth — used by state_engine.derive_vendor_mood
+# (score > threshold → mood), checked top-down; anything lower is ANGRY.
+MOOD_THRESHOLDS: Final[tuple[tuple[int, VendorMood], ...]] = (
+    (80, VendorMood.ENTHUSIASTIC),
+    (60, VendorMood.FRIENDLY),
+    (40, VendorMood.NEUTRAL),
+    (20, VendorMood.ANNOYED),
+)
@@ -6,14 +6,19 @@ Calls OpenAI GPT-4o with JSON mode, parses the response into AIDecision,
 and handles retries + fallback per rules.md §4 and §6.4.
 
 Retry policy:
-    - Max 2 retries with exponential backoff (1s, 2s).
+    - Max 2 retries with exponential backoff (1s, 2s) plus up to 10% jitter.
+    - All attempts share one AI_TIMEOUT_MS deadline: each call gets the
+      remaining budget as its timeout, backoff sleeps are capped at half
+      of what is left, and an exhausted budget goes straight to fallback.
+    - The SDK's own retries are off (max_retries=0) and every call also
+      runs under asyncio.timeout, so no attempt can outlive the deadline.
     - Retry only on 5xx / timeout / rate-limit (429).
     - Never retry on 4xx (bad request, auth failure).
     - On persistent failure: return in-character fallback response.
     - On JSON parse failure: retry once with a simplified prompt, then fallback.
 
 Timeouts:
-    - AI_TIMEOUT_MS from config (default 10 000 ms).
+    - AI_TIMEOUT_MS from config (default 10 000 ms), total across retries.
 """
 
 from __future__ import annotations
@@ -21,8 +26,11 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from typing import Any
+import random
+from functools import cached_property
+from typing import Any, Optional
 
+import orjson
 from openai import (
     APIConnectionError,
     APITimeoutError,
@@ -41,10 +49,30 @@ from app.prompts.vendor_system import PROMPT_VERSION
 logger = logging.getLogger("samvadxr")
 
 # Errors that are safe to retry
-_RETRYABLE_ERRORS = (APITimeoutError, APIConnectionError, InternalServerError, RateLimitError)
+# (TimeoutError is raised by the asyncio.timeout guard around each call)
+_RETRYABLE_ERRORS = (
+    APITimeoutError,
+    APIConnectionError,
+    InternalServerError,
+    RateLimitError,
+    TimeoutError,
+)
+
+# Malformed or off-schema LLM output — retried with the same prompt
+_PARSE_ERRORS = (json.JSONDecodeError, ValidationError, KeyError)
 
 # Backoff delays in seconds for each retry attempt
-_BACKOFF_DELAYS = [1.0, 2.0]
+_BACKOFF_DELAYS = (1.0, 2.0)
+
+# 1 initial attempt + one per backoff delay
+_MAX_ATTEMPTS = 1 + len(_BACKOFF_DELAYS)
+
+# Random extra delay, as a fraction of the base delay (de-syncs retries)
+_BACKOFF_JITTER = 0.1
+
+# Floor for a single call's timeout, so a nearly spent budget still
+# gives the request a chance instead of timing out instantly
+_MIN_CALL_TIMEOUT_S = 0.1
 
 # ── Fallback response — in-character, safe, keeps current stage ──
 _FALLBACK_DECISION = AIDecision(
@@ -68,10 +96,8 @@ class OpenAILLMService:
 
     def __init__(self) -> None:
         settings = get_settings()
-        self._client = AsyncOpenAI(
-            api_key=settings.openai_api_key,
-            timeout=settings.ai_timeout_ms / 1000.0,  # SDK wants seconds
-        )
+        self._api_key = settings.openai_api_key
+        self._timeout_s = settings.ai_timeout_ms / 1000.0  # SDK wants seconds
         self._model = settings.openai_model
         self._default_temperature = settings.ai_temperature
         self._default_max_tokens = settings.ai_max_tokens
@@ -86,6 +112,22 @@ class OpenAILLMService:
             },
         )
 
+    @cached_property
+    def _client(self) -> AsyncOpenAI:
+        """OpenAI client, built on first use.
+
+        Constructing AsyncOpenAI sets up an HTTP connection pool, so it is
+        deferred until a call is actually made. Assigning ``_client``
+        directly (as tests do) shadows it and the real client is never built.
+
+        The SDK's built-in retries are disabled: it would re-apply each
+        call's timeout per attempt, tripling the budget. Retries live in
+        generate_decision() instead.
+        """
+        return AsyncOpenAI(
+            api_key=self._api_key, timeout=self._timeout_s, max_retries=0
+        )
+
     async def generate_decision(
         self,
         system_prompt: str,
@@ -93,6 +135,7 @@ class OpenAILLMService:
         *,
         temperature: float = 0.7,
         max_tokens: int = 200,
+        session_id: Optional[str] = None,
     ) -> AIDecision:
         """Call OpenAI and return a parsed AIDecision.
 
@@ -111,13 +154,25 @@ class OpenAILLMService:
         # ── Attempt loop (1 initial + up to 2 retries) ──
         last_error: Exception | None = None
         raw_content: str | None = None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._timeout_s
+
+        for attempt in range(_MAX_ATTEMPTS):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                logger.warning(
+                    "LLM time budget exhausted — skipping remaining retries",
+                    extra={"step": "llm_deadline", "attempt": attempt + 1},
+                )
+                break
 
-        for attempt in range(1 + len(_BACKOFF_DELAYS)):
             try:
                 raw_content = await self._call_openai(
                     messages=messages,
                     temperature=temperature,
                     max_tokens=max_tokens,
+                    timeout=max(_MIN_CALL_TIMEOUT_S, remaining),
+                    session_id=session_id,
                 )
 
                 logger.debug(
@@ -135,7 +190,7 @@ class OpenAILLMService:
             except _RETRYABLE_ERRORS as exc:
                 last_error = exc
                 if attempt < len(_BACKOFF_DELAYS):
-                    delay = _BACKOFF_DELAYS[attempt]
+                    delay = self._backoff_delay(attempt, deadline - loop.time())
                     logger.warning(
                         "OpenAI transient error — retrying",
                         extra={
@@ -156,7 +211,7 @@ class OpenAILLMService:
                         },
                     )
 
-            except (json.JSONDecodeError, ValidationError, KeyError) as exc:
+            except _PARSE_ERRORS as exc:
                 # Parse failure — retry once with the same prompt
                 last_error = exc
                 logger.warning(
@@ -169,7 +224,9 @@ class OpenAILLMService:
                     },
                 )
                 if attempt < len(_BACKOFF_DELAYS):
-                    await asyncio.sleep(_BACKOFF_DELAYS[attempt])
+                    await asyncio.sleep(
+                        self._backoff_delay(attempt, deadline - loop.time())
+                    )
                 else:
                     break
 
@@ -196,21 +253,41 @@ class OpenAILLMService:
         )
         return _FALLBACK_DECISION
 
+    @staticmethod
+    def _user_kwargs(session_id: Optional[str]) -> dict[str, str]:
+        """OpenAI ``user`` tag, so a session's requests share a prompt-cache route."""
+        return {"user": session_id} if session_id else {}
+
+    @staticmethod
+    def _backoff_delay(attempt: int, remaining: float) -> float:
+        """Jittered backoff for *attempt*, capped at half the remaining budget."""
+        base = _BACKOFF_DELAYS[attempt]
+        delay = base + random.random() * base * _BACKOFF_JITTER
+        return max(0.0, min(delay, remaining / 2))
+
     async def _call_openai(
         self,
         *,
         messages: list[dict[str, str]],
         temperature: float,
         max_tokens: int,
+        timeout: float,
+        session_id: Optional[str] = None,
     ) -> str:
-        """Make the actual OpenAI API call and return raw content string."""
-        response = await self._client.chat.completions.create(
-            model=self._model,
-            messages=messages,
-            response_format={"type": "json_object"},
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
+        """Make the actual OpenAI API call and return raw content string.
+
+        Raises TimeoutError if the call is still running after ``timeout``.
+        """
+        async with asyncio.timeout(timeout):
+            response = await self._client.chat.completions.create(
+                model=self._model,
+                messages=messages,
+                response_format={"type": "json_object"},
+                temperature=temperature,
+                max_tokens=max_tokens,
+                timeout=timeout,
+                **self._user_kwargs(session_id),
+            )
         content = response.choices[0].message.content
         if content is None:
             raise BrainServiceError("OpenAI returned empty content")
@@ -222,6 +299,11 @@ class OpenAILLMService:
 
         Handles minor LLM quirks:
         - Strips markdown code fences if present.
+
+        Raises:
+            json.JSONDecodeError: Malformed JSON (orjson.JSONDecodeError
+                subclasses it, so existing handlers still match).
+            ValidationError: JSON does not match the AIDecision schema.
         """
         # Strip markdown code fences sometimes added despite JSON mode
         cleaned = raw_content.strip()
@@ -230,6 +312,6 @@ class OpenAILLMService:
             if cleaned.endswith("```"):
                 cleaned = cleaned[:-3].strip()
 
-        data: dict[str, Any] = json.loads(cleaned)
+        data: dict[str, Any] = orjson.loads(cleaned)
 
         return AIDecision.model_validate(data)
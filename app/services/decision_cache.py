@@ -0,0 +1,116 @@
+"""
+In-process cache for LLM decisions — wraps any LLMService.
+
+Identical turns (same system prompt, same normalised user message, same
+sampling params) skip the OpenAI round-trip and reuse the earlier
+AIDecision. The system prompt already carries the full game state
+(happiness, stage, turn count, object, graph context), so a hit can only
+happen for a turn whose authoritative state is exactly the same —
+typically a client retry or an idle filler phrase ("ok", "aur dikhao").
+
+Cache hits are tagged "[CACHE]" in internal_reasoning. Fallback decisions
+are never cached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from app.models.response import AIDecision
+from app.services.protocols import LLMService
+
+logger = logging.getLogger("samvadxr")
+
+
+class CachingLLMService:
+    """LLMService wrapper with a bounded, TTL-expiring decision cache.
+
+    Implements the LLMService protocol by delegating misses to ``inner``.
+    Entries are evicted least-recently-used once ``max_entries`` is reached.
+    All access happens on the event loop thread, so no locking is needed.
+    """
+
+    def __init__(
+        self,
+        inner: LLMService,
+        *,
+        max_entries: int = 10_000,
+        ttl_s: float = 3600.0,
+    ) -> None:
+        self._inner = inner
+        self._max_entries = max_entries
+        self._ttl_s = ttl_s
+        self._entries: OrderedDict[bytes, tuple[float, AIDecision]] = OrderedDict()
+
+    async def generate_decision(
+        self,
+        system_prompt: str,
+        user_message: str,
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 200,
+        session_id: Optional[str] = None,
+    ) -> AIDecision:
+        """Return a cached AIDecision for this exact turn, or ask ``inner``."""
+        key = self._key(system_prompt, user_message, temperature, max_tokens)
+
+        cached = self._get(key)
+        if cached is not None:
+            logger.info("LLM decision cache hit", extra={"step": "llm_cache"})
+            return cached.model_copy(
+                update={"internal_reasoning": f"[CACHE] {cached.internal_reasoning}"}
+            )
+
+        decision = await self._inner.generate_decision(
+            system_prompt,
+            user_message,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            session_id=session_id,
+        )
+        if not decision.internal_reasoning.startswith("[FALLBACK]"):
+            self._put(key, decision)
+        return decision
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+
+    # ── Internal helpers ──────────────────────────────────
+
+    @staticmethod
+    def _key(
+        system_prompt: str,
+        user_message: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> bytes:
+        """16-byte digest of the prompt pair; user text is case/space-folded."""
+        normalized = " ".join(user_message.lower().split())
+        h = hashlib.blake2b(digest_size=16)
+        h.update(system_prompt.encode())
+        h.update(b"\0")
+        h.update(normalized.encode())
+        h.update(f"\0{temperature}\0{max_tokens}".encode())
+        return h.digest()
+
+    def _get(self, key: bytes) -> AIDecision | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, decision = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return decision
+
+    def _put(self, key: bytes, decision: AIDecision) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl_s, decision)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
@@ -14,6 +14,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
+from functools import lru_cache
 from typing import Any, Optional
 
 from app.models.enums import NegotiationStage, VendorMood
@@ -26,11 +28,116 @@ logger = logging.getLogger("samvadxr")
 #  Mock LLM Service
 # ═══════════════════════════════════════════════════════════
 
+# ── Keyword routing table (highest priority first) ──
+_KEYWORD_ROUTES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("greeting", ("namaste", "hello", "namaskar")),
+    ("inquiry", ("kitne", "price", "cost", "kidhar", "कितने")),
+    ("walkaway", ("nahi", "no", "chhodo", "chalo", "bahut")),
+    ("deal", ("theek", "deal", "done", "pakka", "le lo")),
+)
+
+# keyword → (priority, route)
+_KEYWORD_INDEX: dict[str, tuple[int, str]] = {
+    kw: (priority, route)
+    for priority, (route, keywords) in enumerate(_KEYWORD_ROUTES)
+    for kw in keywords
+}
+
+# One pass over the speech for every keyword. The zero-width lookahead
+# reports a match at every position, so overlapping keywords are all seen
+# — same substring semantics as a chain of `kw in speech` checks.
+_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kw in _KEYWORD_INDEX) + "))"
+)
+
+
+# Memoised: pure over a str, and tests and demo sessions repeat the same
+# handful of phrases. Only the route name is cached; decisions are still
+# copied per call.
+@lru_cache(maxsize=256)
+def _match_route(speech: str) -> Optional[str]:
+    """Return the highest-priority route whose keyword occurs in speech."""
+    best: Optional[tuple[int, str]] = None
+    for match in _KEYWORD_RE.finditer(speech):
+        hit = _KEYWORD_INDEX[match.group(1)]
+        if hit[0] == 0:
+            return hit[1]
+        if best is None or hit < best:
+            best = hit
+    return best[1] if best else None
+
+
+# Canned decisions, built once: the mock's output depends only on the
+# keyword route, so there is nothing to rebuild per call. Keys are the
+# _KEYWORD_ROUTES names plus "empty" (no speech) and "default".
+_CANNED_DECISIONS: dict[str, AIDecision] = {
+    "greeting": AIDecision(
+        reply_text="Welcome, welcome! Come, come, see what all I have for you!",
+        happiness_score=55,
+        negotiation_state=NegotiationStage.GREETING,
+        vendor_mood=VendorMood.FRIENDLY,
+        internal_reasoning="[MOCK] User greeted → greeting response",
+        counter_price=None,
+        offer_assessment="none",
+        suggested_user_response="Can you show me what you have?",
+    ),
+    "inquiry": AIDecision(
+        reply_text="Oh brother, this is the freshest you will find! 60 rupees per kilo, special price just for you!",
+        happiness_score=65,
+        negotiation_state=NegotiationStage.INQUIRY,
+        vendor_mood=VendorMood.FRIENDLY,
+        internal_reasoning="[MOCK] User asked price → inquiry response",
+        counter_price=60,
+        offer_assessment="none",
+        suggested_user_response="That seems a bit high. How about 40 rupees?",
+    ),
+    "walkaway": AIDecision(
+        reply_text="Wait, wait! Don't say that, just listen a little more!",
+        happiness_score=35,
+        negotiation_state=NegotiationStage.WALKAWAY,
+        vendor_mood=VendorMood.ANNOYED,
+        internal_reasoning="[MOCK] User rejecting → walkaway response",
+        counter_price=None,
+        offer_assessment="none",
+        suggested_user_response="Okay, what is your best price then?",
+    ),
+    "deal": AIDecision(
+        reply_text="Wonderful! Deal is done! You are a very good customer!",
+        happiness_score=85,
+        negotiation_state=NegotiationStage.DEAL,
+        vendor_mood=VendorMood.ENTHUSIASTIC,
+        internal_reasoning="[MOCK] User agreed → deal response",
+        counter_price=55,
+        offer_assessment="excellent",
+        suggested_user_response="Thank you! Please pack it up.",
+    ),
+    "empty": AIDecision(
+        reply_text="Did you say something? Come here brother, let me show you!",
+        happiness_score=50,
+        negotiation_state=NegotiationStage.GREETING,
+        vendor_mood=VendorMood.NEUTRAL,
+        internal_reasoning="[MOCK] Empty input → vendor prompts user",
+        counter_price=None,
+        offer_assessment="none",
+        suggested_user_response="Hello! I am looking to buy something.",
+    ),
+    "default": AIDecision(
+        reply_text="Yes, yes, very good choice! Want to see anything else?",
+        happiness_score=50,
+        negotiation_state=NegotiationStage.GREETING,
+        vendor_mood=VendorMood.NEUTRAL,
+        internal_reasoning="[MOCK] Default → greeting response",
+        counter_price=None,
+        offer_assessment="none",
+        suggested_user_response="How much does this cost?",
+    ),
+}
+
 
 class MockLLMService:
     """Deterministic LLM mock — returns canned AIDecision based on keywords.
 
-    Keyword routing (checked in order):
+    Keyword routing (_KEYWORD_ROUTES, highest priority first):
         - "namaste" / "hello"     → GREETING response
         - "kitne" / "price" / "cost" → INQUIRY response
         - "nahi" / "no" / "chhodo" → WALKAWAY response
@@ -38,9 +145,12 @@ class MockLLMService:
         - (empty string)          → vendor prompts the user
         - (default)               → neutral GREETING response
 
-    Simulates ~200ms latency via asyncio.sleep.
+    Simulates ~200ms latency via asyncio.sleep. The delay is the
+    ``simulated_latency_s`` class attribute, so tests can turn it off.
     """
 
+    simulated_latency_s: float = 0.2
+
     async def generate_decision(
         self,
         system_prompt: str,
@@ -48,10 +158,11 @@ class MockLLMService:
         *,
         temperature: float = 0.7,
         max_tokens: int = 200,
+        session_id: Optional[str] = None,
     ) -> AIDecision:
         """Return a deterministic AIDecision based on keyword matching."""
         # Simulate LLM latency
-        await asyncio.sleep(0.2)
+        await asyncio.sleep(self.simulated_latency_s)
 
         text_lower = user_message.lower()
 
@@ -62,13 +173,15 @@ class MockLLMService:
         #   --- END USER MESSAGE ---
         # Extract only the user's speech for keyword matching to avoid false
         # positives from context/scene fields.
-        if "--- user message ---" in text_lower:
-            after_marker = text_lower.split("--- user message ---", 1)[1]
-            speech = after_marker.split("--- end user message ---", 1)[0].strip()
-        elif "user says:" in text_lower:
-            speech = text_lower.split("user says:", 1)[1].split("\n", 1)[0].strip()
+        _, marker, after_marker = text_lower.partition("--- user message ---")
+        if marker:
+            speech = after_marker.partition("--- end user message ---")[0].strip()
         else:
-            speech = text_lower
+            _, marker, after_marker = text_lower.partition("user says:")
+            if marker:
+                speech = after_marker.partition("\n")[0].strip()
+            else:
+                speech = text_lower
 
         logger.debug(
             "MockLLMService: generating decision",
@@ -76,77 +189,12 @@ class MockLLMService:
         )
 
         # ── Keyword routing ───────────────────────────────
-        if any(kw in speech for kw in ("namaste", "hello", "namaskar")):
-            return AIDecision(
-                reply_text="Welcome, welcome! Come, come, see what all I have for you!",
-                happiness_score=55,
-                negotiation_state=NegotiationStage.GREETING,
-                vendor_mood=VendorMood.FRIENDLY,
-                internal_reasoning="[MOCK] User greeted → greeting response",
-                counter_price=None,
-                offer_assessment="none",
-                suggested_user_response="Can you show me what you have?",
-            )
-
-        if any(kw in speech for kw in ("kitne", "price", "cost", "kidhar", "कितने")):
-            return AIDecision(
-                reply_text="Oh brother, this is the freshest you will find! 60 rupees per kilo, special price just for you!",
-                happiness_score=65,
-                negotiation_state=NegotiationStage.INQUIRY,
-                vendor_mood=VendorMood.FRIENDLY,
-                internal_reasoning="[MOCK] User asked price → inquiry response",
-                counter_price=60,
-                offer_assessment="none",
-                suggested_user_response="That seems a bit high. How about 40 rupees?",
-            )
-
-        if any(kw in speech for kw in ("nahi", "no", "chhodo", "chalo", "bahut")):
-            return AIDecision(
-                reply_text="Wait, wait! Don't say that, just listen a little more!",
-                happiness_score=35,
-                negotiation_state=NegotiationStage.WALKAWAY,
-                vendor_mood=VendorMood.ANNOYED,
-                internal_reasoning="[MOCK] User rejecting → walkaway response",
-                counter_price=None,
-                offer_assessment="none",
-                suggested_user_response="Okay, what is your best price then?",
-            )
+        route = _match_route(speech)
+        if route is None:
+            route = "default" if speech.strip() else "empty"
 
-        if any(kw in speech for kw in ("theek", "deal", "done", "pakka", "le lo")):
-            return AIDecision(
-                reply_text="Wonderful! Deal is done! You are a very good customer!",
-                happiness_score=85,
-                negotiation_state=NegotiationStage.DEAL,
-                vendor_mood=VendorMood.ENTHUSIASTIC,
-                internal_reasoning="[MOCK] User agreed → deal response",
-                counter_price=55,
-                offer_assessment="excellent",
-                suggested_user_response="Thank you! Please pack it up.",
-            )
-
-        if not speech.strip():
-            return AIDecision(
-                reply_text="Did you say something? Come here brother, let me show you!",
-                happiness_score=50,
-                negotiation_state=NegotiationStage.GREETING,
-                vendor_mood=VendorMood.NEUTRAL,
-                internal_reasoning="[MOCK] Empty input → vendor prompts user",
-                counter_price=None,
-                offer_assessment="none",
-                suggested_user_response="Hello! I am looking to buy something.",
-            )
-
-        # Default: neutral greeting response
-        return AIDecision(
-            reply_text="Yes, yes, very good choice! Want to see anything else?",
-            happiness_score=50,
-            negotiation_state=NegotiationStage.GREETING,
-            vendor_mood=VendorMood.NEUTRAL,
-            internal_reasoning="[MOCK] Default → greeting response",
-            counter_price=None,
-            offer_assessment="none",
-            suggested_user_response="How much does this cost?",
-        )
+        # Copy so callers can never mutate the shared canned instance
+        return _CANNED_DECISIONS[route].model_copy()
 
 
 # ═══════════════════════════════════════════════════════════
@@ -310,6 +358,18 @@ class MockSessionStore:
 
     # ── Test helpers (not part of protocol) ───────────────
 
+    def seed(self, session_id: str, **fields: Any) -> None:
+        """Install a session directly: defaults overlaid with ``fields``.
+
+        Replaces a create → load → mutate → save sequence in test setup.
+        For testing only.
+        """
+        self._sessions[session_id] = {
+            "session_id": session_id,
+            **_DEFAULT_SESSION_STATE,
+            **fields,
+        }
+
     def clear(self) -> None:
         """Clear all sessions and graph data. For testing only."""
         self._sessions.clear()
@@ -37,6 +37,7 @@ class LLMService(Protocol):
         *,
         temperature: float = 0.7,
         max_tokens: int = 200,
+        session_id: Optional[str] = None,
     ) -> AIDecision:
         """Send a prompt to the LLM and return a parsed AIDecision.
 
@@ -45,6 +46,9 @@ class LLMService(Protocol):
             user_message: The user's turn (transcribed text + scene info).
             temperature: Sampling temperature (0.0-2.0).
             max_tokens: Max response tokens.
+            session_id: Session the turn belongs to. Real implementations
+                may forward it to the provider (e.g. OpenAI's ``user``
+                field); mocks ignore it.
 
         Returns:
             Parsed AIDecision from the LLM's JSON output.
@@ -4,7 +4,7 @@ Neo4j session state persistence — the ONLY module that imports neo4j.
 All Cypher queries live here. No other module touches the driver directly.
 
 Provides:
-    - init_neo4j(uri, user, password)  → initialise the async driver
+    - init_neo4j(uri, user, password)  → initialise the async driver + indexes
     - close_neo4j()                    → shut down the driver
     - Neo4jSessionStore                → SessionStore protocol impl
 
@@ -26,11 +26,13 @@ Graph schema:
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-from neo4j import AsyncGraphDatabase, AsyncDriver
+from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncSession, RoutingControl
 
 from ..exceptions import StateStoreError
 
@@ -50,12 +52,17 @@ async def init_neo4j(
     user: str = "neo4j",
     password: str = "",
     timeout_ms: int = 2000,
+    max_retry_time_ms: int = 2000,
 ) -> None:
     """Initialise the Neo4j async driver and verify connectivity.
 
     Must be called once at app startup — either by our FastAPI lifespan
     or by Dev B's lifespan hook.
 
+    ``max_retry_time_ms`` bounds how long the driver keeps retrying a
+    managed transaction after a transient error (leader switch, dropped
+    connection, deadlock) before giving up.
+
     Raises:
         StateStoreError: If the driver cannot connect.
     """
@@ -68,20 +75,32 @@ async def init_neo4j(
         )
         await close_neo4j()
 
+    driver: Optional[AsyncDriver] = None
     try:
-        _driver = AsyncGraphDatabase.driver(
+        driver = _driver = AsyncGraphDatabase.driver(
             uri,
             auth=(user, password),
             connection_acquisition_timeout=timeout_ms / 1000.0,
             max_connection_lifetime=300,  # 5 min
+            max_transaction_retry_time=max_retry_time_ms / 1000.0,
         )
-        await _driver.verify_connectivity()
+        # Index creation is independent of the connectivity probe, so run
+        # both together — cold start costs the longer of the two, not the sum.
+        # The task group cancels index creation if the probe fails.
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(driver.verify_connectivity())
+            tg.create_task(_create_indexes(driver))
         logger.info(
             "Neo4j driver initialised and connected",
             extra={"step": "neo4j_init", "uri": uri},
         )
     except Exception as exc:
+        if isinstance(exc, ExceptionGroup):
+            exc = exc.exceptions[0]
         _driver = None
+        if driver is not None:
+            with contextlib.suppress(Exception):
+                await driver.close()
         logger.error(
             "Neo4j connection failed",
             extra={"step": "neo4j_init", "error": str(exc)},
@@ -98,6 +117,22 @@ async def close_neo4j() -> None:
         logger.info("Neo4j driver closed", extra={"step": "neo4j_shutdown"})
 
 
+async def _create_indexes(driver: AsyncDriver) -> None:
+    """Create the lookup indexes used by every per-session query.
+
+    Idempotent (IF NOT EXISTS). Failure is logged but never raised — the
+    store still works without indexes, just with label scans.
+    """
+    try:
+        for query in _Q_CREATE_INDEXES:
+            await driver.execute_query(query, database_="neo4j")
+    except Exception as exc:
+        logger.warning(
+            "Neo4j index creation failed (non-critical)",
+            extra={"step": "neo4j_init", "error": str(exc)},
+        )
+
+
 def get_driver() -> AsyncDriver:
     """Return the active Neo4j driver, or raise if not initialised."""
     if _driver is None:
@@ -118,6 +153,164 @@ _DEFAULT_STATE: dict[str, Any] = {
 }
 
 
+# ═══════════════════════════════════════════════════════════
+#  Cypher queries
+# ═══════════════════════════════════════════════════════════
+#
+# Defined once at import time so every call sends the identical string —
+# the server's query-plan cache is keyed on the exact query text.
+
+_Q_CREATE_INDEXES = (
+    "CREATE INDEX session_by_id IF NOT EXISTS FOR (s:Session) ON (s.session_id)",
+    "CREATE INDEX turn_by_session IF NOT EXISTS "
+    "FOR (t:Turn) ON (t.session_id, t.turn_number)",
+    "CREATE INDEX item_by_session IF NOT EXISTS "
+    "FOR (i:Item) ON (i.session_id, i.name)",
+)
+
+_Q_CREATE = """
+    MERGE (s:Session {session_id: $session_id})
+    ON CREATE SET s += $props, s.created_at = $now, s.updated_at = $now
+    RETURN s
+"""
+
+_Q_LOAD = """
+    MATCH (s:Session {session_id: $session_id})
+    RETURN s
+"""
+
+_Q_SAVE = """
+    MERGE (s:Session {session_id: $session_id})
+    SET s += $props, s.updated_at = $now
+"""
+
+_Q_DELETE = """
+    MATCH (s:Session {session_id: $session_id})
+    OPTIONAL MATCH (s)-[r1]->(t:Turn)
+    OPTIONAL MATCH (s)-[r2]->(i:Item)
+    OPTIONAL MATCH (s)-[r3]->(st:StageTransition)
+    OPTIONAL MATCH (t)-[r4]->()
+    DETACH DELETE s, t, i, st
+"""
+
+_Q_DELETE_ALL_CHILDREN = (
+    "MATCH (n) WHERE n:Turn OR n:Item OR n:StageTransition DETACH DELETE n"
+)
+
+_Q_DELETE_ALL_SESSIONS = "MATCH (s:Session) WITH s LIMIT 10000 DETACH DELETE s"
+
+_Q_RECORD_TURN = """
+    MATCH (s:Session {session_id: $session_id})
+    CREATE (t:Turn {
+        session_id: $session_id,
+        turn_number: $turn_number,
+        role: $role,
+        text_snippet: $text_snippet,
+        happiness_score: $happiness_score,
+        stage: $stage,
+        object_grabbed: $object_grabbed,
+        timestamp: $now
+    })
+    CREATE (s)-[:HAS_TURN]->(t)
+    WITH s, t
+    OPTIONAL MATCH (s)-[:HAS_TURN]->(prev:Turn)
+    WHERE prev.turn_number = $prev_turn AND prev.session_id = $session_id
+    FOREACH (_ IN CASE WHEN prev IS NOT NULL THEN [1] ELSE [] END |
+        CREATE (prev)-[:FOLLOWED_BY]->(t)
+    )
+    RETURN t
+"""
+
+_Q_STAGE_TRANSITION = """
+    MATCH (s:Session {session_id: $session_id})
+    CREATE (st:StageTransition {
+        session_id: $session_id,
+        from_stage: $from_stage,
+        to_stage: $to_stage,
+        at_turn: $turn_number,
+        happiness_at_transition: $happiness_score,
+        timestamp: $now
+    })
+    CREATE (s)-[:STAGE_CHANGED]->(st)
+    RETURN st
+"""
+
+_Q_GRAPH_TURNS = """
+    MATCH (s:Session {session_id: $session_id})-[:HAS_TURN]->(t:Turn)
+    RETURN t.turn_number AS turn_number,
+           t.role AS role,
+           t.text_snippet AS text_snippet,
+           t.happiness_score AS happiness_score,
+           t.stage AS stage,
+           t.object_grabbed AS object_grabbed,
+           t.timestamp AS timestamp
+    ORDER BY t.turn_number
+"""
+
+_Q_GRAPH_TRANSITIONS = """
+    MATCH (s:Session {session_id: $session_id})-[:STAGE_CHANGED]->(st:StageTransition)
+    RETURN st.from_stage AS from_stage,
+           st.to_stage AS to_stage,
+           st.at_turn AS at_turn,
+           st.happiness_at_transition AS happiness_at_transition
+    ORDER BY st.at_turn
+"""
+
+_Q_GRAPH_ITEMS = """
+    MATCH (s:Session {session_id: $session_id})-[:INVOLVES_ITEM]->(i:Item)
+    OPTIONAL MATCH (t:Turn)-[:ABOUT_ITEM]->(i)
+    WHERE t.session_id = $session_id
+    WITH i.name AS item_name,
+         min(t.turn_number) AS first_mentioned,
+         max(t.turn_number) AS last_mentioned,
+         count(t) AS mention_count
+    RETURN item_name, first_mentioned, last_mentioned, mention_count
+    ORDER BY first_mentioned
+"""
+
+_Q_ITEM_LINK = """
+    MATCH (s:Session {session_id: $session_id})
+    MATCH (s)-[:HAS_TURN]->(t:Turn {turn_number: $turn_number, session_id: $session_id})
+    MERGE (i:Item {name: $item_name, session_id: $session_id})
+    MERGE (t)-[:ABOUT_ITEM]->(i)
+    MERGE (s)-[:INVOLVES_ITEM]->(i)
+    RETURN i
+"""
+
+
+# ═══════════════════════════════════════════════════════════
+#  Transaction functions
+# ═══════════════════════════════════════════════════════════
+#
+# Run through session.execute_read / execute_write, which retry the whole
+# function on transient errors within max_transaction_retry_time. Only
+# idempotent queries go through here — a retried CREATE would duplicate
+# nodes, so turn and stage-transition recording stay auto-commit.
+
+
+async def _tx_single(tx: Any, query: str, params: dict[str, Any]) -> Any:
+    """Run *query* and return its single record (or None)."""
+    result = await tx.run(query, params)
+    return await result.single()
+
+
+async def _tx_consume(tx: Any, query: str, params: dict[str, Any]) -> None:
+    """Run *query* for its side effects only."""
+    result = await tx.run(query, params)
+    await result.consume()
+
+
+async def _tx_graph_context(
+    tx: Any, session_id: str
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
+    """Fetch turns, stage transitions and items in one read transaction."""
+    params = {"session_id": session_id}
+    turns = await (await tx.run(_Q_GRAPH_TURNS, params)).data()
+    transitions = await (await tx.run(_Q_GRAPH_TRANSITIONS, params)).data()
+    items = await (await tx.run(_Q_GRAPH_ITEMS, params)).data()
+    return turns, transitions, items
+
+
 # ═══════════════════════════════════════════════════════════
 #  Neo4jSessionStore — conforms to SessionStore protocol
 # ═══════════════════════════════════════════════════════════
@@ -128,8 +321,36 @@ class Neo4jSessionStore:
 
     Every method acquires a session from the driver, runs a Cypher query,
     and returns a plain dict matching the SessionStore protocol.
+
+    The driver is looked up lazily on first use and cached on the
+    instance, so the store can be constructed before init_neo4j() runs.
+    The cache follows close_neo4j()/init_neo4j(): a replaced driver is
+    picked up on the next access.
     """
 
+    def __init__(self) -> None:
+        self._driver: Optional[AsyncDriver] = None
+
+    @property
+    def driver(self) -> AsyncDriver:
+        """The active Neo4j driver, re-resolved if the module one changed."""
+        if self._driver is None or self._driver is not _driver:
+            self._driver = get_driver()
+        return self._driver
+
+    def _session(self) -> AsyncSession:
+        """Open a driver session chained to execute_query's bookmarks.
+
+        load_session reads through execute_query with READ routing. Sharing
+        its bookmark manager makes that read wait for every earlier write,
+        so a lagging cluster reader cannot return a stale turn.
+        """
+        driver = self.driver
+        return driver.session(
+            database="neo4j",
+            bookmark_manager=driver.execute_query_bookmark_manager,
+        )
+
     # ── Create ────────────────────────────────────────────
 
     async def create_session(self, session_id: str) -> dict[str, Any]:
@@ -138,44 +359,34 @@ class Neo4jSessionStore:
         If a session with the same ID already exists, it is returned
         unchanged (idempotent).
         """
-        driver = get_driver()
         now = datetime.now(timezone.utc).isoformat()
 
-        query = """
-        MERGE (s:Session {session_id: $session_id})
-        ON CREATE SET
-            s.happiness_score   = $happiness_score,
-            s.negotiation_state = $negotiation_state,
-            s.turn_count       = $turn_count,
-            s.created_at       = $now,
-            s.updated_at       = $now
-        RETURN s
-        """
         params = {
             "session_id": session_id,
-            **_DEFAULT_STATE,
+            "props": _DEFAULT_STATE,
             "now": now,
         }
 
         try:
-            async with driver.session(database="neo4j") as session:
-                result = await session.run(query, params)
-                record = await result.single()
-                if record is None:
-                    raise StateStoreError(
-                        f"Failed to create session {session_id}"
-                    )
-                node = record["s"]
-                state = self._node_to_dict(node, session_id)
-
-                logger.info(
-                    "Neo4j session created",
-                    extra={
-                        "step": "neo4j_create",
-                        "session_id": session_id,
-                    },
+            async with self._session() as session:
+                record = await session.execute_write(
+                    _tx_single, _Q_CREATE, params
+                )
+            if record is None:
+                raise StateStoreError(
+                    f"Failed to create session {session_id}"
                 )
-                return state
+            node = record["s"]
+            state = self._node_to_dict(node, session_id)
+
+            logger.info(
+                "Neo4j session created",
+                extra={
+                    "step": "neo4j_create",
+                    "session_id": session_id,
+                },
+            )
+            return state
         except StateStoreError:
             raise
         except Exception as exc:
@@ -194,19 +405,23 @@ class Neo4jSessionStore:
     # ── Load ──────────────────────────────────────────────
 
     async def load_session(self, session_id: str) -> Optional[dict[str, Any]]:
-        """Load session state from Neo4j. Returns None if not found."""
-        driver = get_driver()
+        """Load session state from Neo4j. Returns None if not found.
 
-        query = """
-        MATCH (s:Session {session_id: $session_id})
-        RETURN s
+        Runs with READ routing so a cluster can serve it from a secondary.
+        Writes go through _session(), which shares execute_query's bookmark
+        manager, so this read always sees the latest save_session/record_turn.
+        execute_query retries transient errors the same way a managed
+        transaction does.
         """
-
         try:
-            async with driver.session(database="neo4j") as session:
-                result = await session.run(query, {"session_id": session_id})
-                record = await result.single()
-                if record is None:
+            records, _, _ = await self.driver.execute_query(
+                _Q_LOAD,
+                {"session_id": session_id},
+                database_="neo4j",
+                routing_=RoutingControl.READ,
+            )
+            if not records:
+                if logger.isEnabledFor(logging.DEBUG):
                     logger.debug(
                         "Neo4j session not found",
                         extra={
@@ -214,10 +429,11 @@ class Neo4jSessionStore:
                             "session_id": session_id,
                         },
                     )
-                    return None
-                node = record["s"]
-                state = self._node_to_dict(node, session_id)
+                return None
+            node = records[0]["s"]
+            state = self._node_to_dict(node, session_id)
 
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     "Neo4j session loaded",
                     extra={
@@ -226,7 +442,7 @@ class Neo4jSessionStore:
                         "turn_count": state.get("turn_count", 0),
                     },
                 )
-                return state
+            return state
         except StateStoreError:
             raise
         except Exception as exc:
@@ -251,34 +467,26 @@ class Neo4jSessionStore:
 
         Creates the node if it doesn't exist (upsert).
         """
-        driver = get_driver()
         now = datetime.now(timezone.utc).isoformat()
 
-        query = """
-        MERGE (s:Session {session_id: $session_id})
-        SET s.happiness_score   = $happiness_score,
-            s.negotiation_state = $negotiation_state,
-            s.turn_count        = $turn_count,
-            s.updated_at        = $now
-        """
-        params = {
-            "session_id": session_id,
+        props = {
             "happiness_score": state.get("happiness_score", 50),
             "negotiation_state": state.get("negotiation_state", "GREETING"),
             "turn_count": state.get("turn_count", 0),
-            "now": now,
         }
+        params = {"session_id": session_id, "props": props, "now": now}
 
         try:
-            async with driver.session(database="neo4j") as session:
-                await session.run(query, params)
+            async with self._session() as session:
+                await session.execute_write(_tx_consume, _Q_SAVE, params)
 
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     "Neo4j session saved",
                     extra={
                         "step": "neo4j_save",
                         "session_id": session_id,
-                        "turn_count": params["turn_count"],
+                        "turn_count": props["turn_count"],
                     },
                 )
         except StateStoreError:
@@ -300,33 +508,23 @@ class Neo4jSessionStore:
 
     async def delete_session(self, session_id: str) -> bool:
         """Delete a session node and all its graph children. Returns True if deleted."""
-        driver = get_driver()
-
-        query = """
-        MATCH (s:Session {session_id: $session_id})
-        OPTIONAL MATCH (s)-[r1]->(t:Turn)
-        OPTIONAL MATCH (s)-[r2]->(i:Item)
-        OPTIONAL MATCH (s)-[r3]->(st:StageTransition)
-        OPTIONAL MATCH (t)-[r4]->()
-        DETACH DELETE s, t, i, st
-        RETURN count(DISTINCT s) AS deleted
-        """
-
         try:
-            async with driver.session(database="neo4j") as session:
-                result = await session.run(query, {"session_id": session_id})
-                record = await result.single()
-                deleted = record["deleted"] > 0 if record else False
+            # No RETURN clause — the deletion count comes from the summary
+            # counters, so no record is materialised.
+            _, summary, _ = await self.driver.execute_query(
+                _Q_DELETE, {"session_id": session_id}, database_="neo4j"
+            )
+            deleted = summary.counters.nodes_deleted > 0
 
-                logger.info(
-                    "Neo4j session deleted",
-                    extra={
-                        "step": "neo4j_delete",
-                        "session_id": session_id,
-                        "deleted": deleted,
-                    },
-                )
-                return deleted
+            logger.info(
+                "Neo4j session deleted",
+                extra={
+                    "step": "neo4j_delete",
+                    "session_id": session_id,
+                    "deleted": deleted,
+                },
+            )
+            return deleted
         except Exception as exc:
             logger.error(
                 "Neo4j delete_session failed",
@@ -347,27 +545,21 @@ class Neo4jSessionStore:
 
         **For testing only.** Use to reset the database to a clean state.
         """
-        driver = get_driver()
-
         try:
-            async with driver.session(database="neo4j") as session:
-                # Delete graph children first, then sessions
-                await session.run(
-                    "MATCH (n) WHERE n:Turn OR n:Item OR n:StageTransition "
-                    "DETACH DELETE n"
-                )
-                result = await session.run(
-                    "MATCH (s:Session) WITH s LIMIT 10000 "
-                    "DETACH DELETE s RETURN count(*) AS total"
-                )
-                record = await result.single()
-                total = record["total"] if record else 0
+            # Delete graph children first, then sessions
+            await self.driver.execute_query(
+                _Q_DELETE_ALL_CHILDREN, database_="neo4j"
+            )
+            _, summary, _ = await self.driver.execute_query(
+                _Q_DELETE_ALL_SESSIONS, database_="neo4j"
+            )
+            total = summary.counters.nodes_deleted
 
-                logger.info(
-                    "Neo4j all sessions deleted",
-                    extra={"step": "neo4j_delete_all", "deleted": total},
-                )
-                return total
+            logger.info(
+                "Neo4j all sessions deleted",
+                extra={"step": "neo4j_delete_all", "deleted": total},
+            )
+            return total
         except Exception as exc:
             logger.error(
                 "Neo4j delete_all_sessions failed",
@@ -397,32 +589,10 @@ class Neo4jSessionStore:
         and chains it to the previous turn via [:FOLLOWED_BY].
         If object_grabbed is provided, creates/links an (:Item) node.
         """
-        driver = get_driver()
         now = datetime.now(timezone.utc).isoformat()
         # Truncate text_snippet to keep graph nodes lightweight
         snippet = (text_snippet[:150] + "...") if len(text_snippet) > 150 else text_snippet
 
-        query = """
-        MATCH (s:Session {session_id: $session_id})
-        CREATE (t:Turn {
-            session_id: $session_id,
-            turn_number: $turn_number,
-            role: $role,
-            text_snippet: $text_snippet,
-            happiness_score: $happiness_score,
-            stage: $stage,
-            object_grabbed: $object_grabbed,
-            timestamp: $now
-        })
-        CREATE (s)-[:HAS_TURN]->(t)
-        WITH s, t
-        OPTIONAL MATCH (s)-[:HAS_TURN]->(prev:Turn)
-        WHERE prev.turn_number = $prev_turn AND prev.session_id = $session_id
-        FOREACH (_ IN CASE WHEN prev IS NOT NULL THEN [1] ELSE [] END |
-            CREATE (prev)-[:FOLLOWED_BY]->(t)
-        )
-        RETURN t
-        """
         params = {
             "session_id": session_id,
             "turn_number": turn_number,
@@ -436,24 +606,27 @@ class Neo4jSessionStore:
         }
 
         try:
-            async with driver.session(database="neo4j") as session:
-                await session.run(query, params)
+            # One driver session for both writes — the item link reuses the
+            # connection instead of checking a second one out of the pool
+            async with self._session() as session:
+                await session.run(_Q_RECORD_TURN, params)
+
+                # If an item was grabbed, record the item interaction
+                if object_grabbed:
+                    await self._record_item_interaction(
+                        session, session_id, turn_number, object_grabbed
+                    )
 
-            # If an item was grabbed, record the item interaction
-            if object_grabbed:
-                await self._record_item_interaction(
-                    session_id, turn_number, object_grabbed
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Neo4j turn recorded",
+                    extra={
+                        "step": "neo4j_record_turn",
+                        "session_id": session_id,
+                        "turn_number": turn_number,
+                        "role": role,
+                    },
                 )
-
-            logger.debug(
-                "Neo4j turn recorded",
-                extra={
-                    "step": "neo4j_record_turn",
-                    "session_id": session_id,
-                    "turn_number": turn_number,
-                    "role": role,
-                },
-            )
         except StateStoreError:
             raise
         except Exception as exc:
@@ -483,22 +656,8 @@ class Neo4jSessionStore:
         [:STAGE_CHANGED]. This provides a clear history of how the
         negotiation has progressed through stages.
         """
-        driver = get_driver()
         now = datetime.now(timezone.utc).isoformat()
 
-        query = """
-        MATCH (s:Session {session_id: $session_id})
-        CREATE (st:StageTransition {
-            session_id: $session_id,
-            from_stage: $from_stage,
-            to_stage: $to_stage,
-            at_turn: $turn_number,
-            happiness_at_transition: $happiness_score,
-            timestamp: $now
-        })
-        CREATE (s)-[:STAGE_CHANGED]->(st)
-        RETURN st
-        """
         params = {
             "session_id": session_id,
             "from_stage": from_stage,
@@ -509,8 +668,8 @@ class Neo4jSessionStore:
         }
 
         try:
-            async with driver.session(database="neo4j") as session:
-                await session.run(query, params)
+            async with self._session() as session:
+                await session.run(_Q_STAGE_TRANSITION, params)
 
             logger.info(
                 "Neo4j stage transition recorded",
@@ -548,75 +707,23 @@ class Neo4jSessionStore:
         Returns a dict with raw graph data that can be formatted into
         a context string for the LLM prompt.
         """
-        driver = get_driver()
-
-        # ── Query 1: Get all turns ────────────────────────
-        turns_query = """
-        MATCH (s:Session {session_id: $session_id})-[:HAS_TURN]->(t:Turn)
-        RETURN t.turn_number AS turn_number,
-               t.role AS role,
-               t.text_snippet AS text_snippet,
-               t.happiness_score AS happiness_score,
-               t.stage AS stage,
-               t.object_grabbed AS object_grabbed,
-               t.timestamp AS timestamp
-        ORDER BY t.turn_number
-        """
-
-        # ── Query 2: Get stage transitions ────────────────
-        transitions_query = """
-        MATCH (s:Session {session_id: $session_id})-[:STAGE_CHANGED]->(st:StageTransition)
-        RETURN st.from_stage AS from_stage,
-               st.to_stage AS to_stage,
-               st.at_turn AS at_turn,
-               st.happiness_at_transition AS happiness_at_transition
-        ORDER BY st.at_turn
-        """
-
-        # ── Query 3: Get items involved ───────────────────
-        items_query = """
-        MATCH (s:Session {session_id: $session_id})-[:INVOLVES_ITEM]->(i:Item)
-        OPTIONAL MATCH (t:Turn)-[:ABOUT_ITEM]->(i)
-        WHERE t.session_id = $session_id
-        WITH i.name AS item_name,
-             min(t.turn_number) AS first_mentioned,
-             max(t.turn_number) AS last_mentioned,
-             count(t) AS mention_count
-        RETURN item_name, first_mentioned, last_mentioned, mention_count
-        ORDER BY first_mentioned
-        """
-
         try:
-            turns: list[dict[str, Any]] = []
-            transitions: list[dict[str, Any]] = []
-            items: list[dict[str, Any]] = []
-
-            async with driver.session(database="neo4j") as session:
-                # Turns
-                result = await session.run(turns_query, {"session_id": session_id})
-                records = await result.data()
-                turns = [dict(r) for r in records]
-
-                # Transitions
-                result = await session.run(transitions_query, {"session_id": session_id})
-                records = await result.data()
-                transitions = [dict(r) for r in records]
-
-                # Items
-                result = await session.run(items_query, {"session_id": session_id})
-                records = await result.data()
-                items = [dict(r) for r in records]
-
-            logger.debug(
-                "Neo4j graph context retrieved",
-                extra={
-                    "step": "neo4j_graph_context",
-                    "session_id": session_id,
-                    "turn_count": len(turns),
-                    "transitions": len(transitions),
-                    "items": len(items),
-                },
-            )
+            async with self._session() as session:
+                turns, transitions, items = await session.execute_read(
+                    _tx_graph_context, session_id
+                )
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Neo4j graph context retrieved",
+                    extra={
+                        "step": "neo4j_graph_context",
+                        "session_id": session_id,
+                        "turn_count": len(turns),
+                        "transitions": len(transitions),
+                        "items": len(items),
+                    },
+                )
 
             return {
                 "turns": turns,
@@ -643,20 +750,14 @@ class Neo4jSessionStore:
 
     async def _record_item_interaction(
         self,
+        session: Any,
         session_id: str,
         turn_number: int,
         item_name: str,
     ) -> None:
-        """Create or link an Item node for this turn and session."""
-        driver = get_driver()
-
-        query = """
-        MATCH (s:Session {session_id: $session_id})
-        MATCH (s)-[:HAS_TURN]->(t:Turn {turn_number: $turn_number, session_id: $session_id})
-        MERGE (i:Item {name: $item_name, session_id: $session_id})
-        MERGE (t)-[:ABOUT_ITEM]->(i)
-        MERGE (s)-[:INVOLVES_ITEM]->(i)
-        RETURN i
+        """Create or link an Item node for this turn and session.
+
+        Runs on the caller's open driver session (``session``).
         """
         params = {
             "session_id": session_id,
@@ -665,8 +766,7 @@ class Neo4jSessionStore:
         }
 
         try:
-            async with driver.session(database="neo4j") as session:
-                await session.run(query, params)
+            await session.execute_write(_tx_consume, _Q_ITEM_LINK, params)
         except Exception as exc:
             # Item linking is non-critical — log but don't raise
             logger.warning(
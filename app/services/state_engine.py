@@ -6,7 +6,10 @@ Every override is logged at WARN level.
 
 Public API:
     validate_transition(current, proposed, happiness_score) → (stage, warnings)
+    validate_transitions_batch(currents, proposeds, scores) → (stages, flags)
     validate_ai_decision(ai_decision, session_state, config) → ValidatedState
+    make_validator(max_mood_delta)          → cached validate_ai_decision partial
+    SessionSnapshot                                         → typed session view
     derive_vendor_mood(happiness_score) → VendorMood
     validate_price_consistency(ai_decision, session_state) → list[str]
 """
@@ -15,13 +18,15 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from typing import Any
+from functools import lru_cache, partial
+from typing import Any, Callable, Final, NamedTuple, Optional, Sequence, Union
 
 from app.models.enums import (
     LEGAL_TRANSITIONS,
     MAX_MOOD_DELTA,
     MOOD_MAX,
     MOOD_MIN,
+    MOOD_THRESHOLDS,
     TERMINAL_STAGES,
     NegotiationStage,
     VendorMood,
@@ -32,7 +37,7 @@ logger = logging.getLogger("samvadxr")
 
 # ── Offer assessment → minimum expected happiness drop ──
 # Used by validate_offer_happiness_consistency()
-_OFFER_MIN_DROPS: dict[str, int] = {
+_OFFER_MIN_DROPS: Final[dict[str, int]] = {
     "insult": 10,     # Must drop at least 10 for insult offers
     "lowball": 6,     # Must drop at least 6 for lowball offers
     "fair": 0,        # Fair offers — drop is expected but not enforced
@@ -41,13 +46,91 @@ _OFFER_MIN_DROPS: dict[str, int] = {
     "none": 0,        # No offer made — no constraint
 }
 
+# ── Override warning templates (filled with str.format_map) ──
+_WARN_TEMPLATES: Final[dict[str, str]] = {
+    "terminal_exit": (
+        "Cannot leave terminal stage {current}. Proposed {proposed} blocked."
+    ),
+    "illegal_transition": (
+        "Illegal transition {current} → {proposed}. "
+        "Legal targets: {legal}. Keeping {current}."
+    ),
+    "walkaway_blocked": (
+        "WALKAWAY → HAGGLING blocked: happiness_score={happiness} "
+        "(must be > 40). Forcing CLOSURE."
+    ),
+    "offer_min_drop": (
+        "Offer assessed as '{assessment}' but happiness only dropped "
+        "{actual} (min required: {min_drop}). "
+        "Forcing happiness: {proposed} → {forced}"
+    ),
+    "price_raised": (
+        "Vendor raised price from {last} to {counter}. "
+        "Prices should only decrease during negotiation."
+    ),
+    "invalid_stage": (
+        "Invalid current stage '{stage}' in session — defaulting to GREETING."
+    ),
+    "happiness_clamped": (
+        "happiness_score clamped: {proposed} → {clamped} "
+        "(current={current}, max_delta=±{max_delta})"
+    ),
+}
+
+# ── Transition graph as bitmasks (built once at import) ──
+# Each stage gets a bit index; _LEGAL_MASK[i] has bit j set when stage i
+# may move to stage j, so validate_transition is a shift-and-test.
+_STAGE_IDX: Final[dict[NegotiationStage, int]] = {
+    stage: i for i, stage in enumerate(NegotiationStage)
+}
+_LEGAL_MASK: Final[tuple[int, ...]] = tuple(
+    sum(1 << _STAGE_IDX[t] for t in LEGAL_TRANSITIONS.get(stage, ()))
+    for stage in NegotiationStage
+)
+_TERMINAL_MASK: Final[int] = sum(1 << _STAGE_IDX[s] for s in TERMINAL_STAGES)
+# Rendered "Legal targets" list per source stage, for illegal_transition.
+# Stored as the formatted string so the shared value can't be mutated.
+_LEGAL_TARGET_STRS: Final[tuple[str, ...]] = tuple(
+    str(sorted(t.value for t in LEGAL_TRANSITIONS.get(stage, ())))
+    for stage in NegotiationStage
+)
+
+# ── Stored stage string → enum member (skips Enum.__call__) ──
+_STAGE_BY_VALUE: Final[dict[str, NegotiationStage]] = {
+    stage.value: stage for stage in NegotiationStage
+}
+
 
 # ═══════════════════════════════════════════════════════════
-#  Validated output container
+#  Session snapshot + validated output container
 # ═══════════════════════════════════════════════════════════
 
 
-@dataclass
+class SessionSnapshot(NamedTuple):
+    """Read-only view of the session fields the state engine uses.
+
+    Defaults match the fallbacks the engine has always applied to a
+    session dict with missing keys. Callers that already hold typed
+    state can pass one straight to validate_ai_decision().
+    """
+
+    happiness_score: int = 50
+    negotiation_state: str = "GREETING"
+    session_id: str = "unknown"
+    turn_count: int = 0
+    last_counter_price: Optional[int] = None
+
+    @classmethod
+    def from_state(cls, session_state: dict[str, Any]) -> SessionSnapshot:
+        """Build a snapshot from a session-store dict in one pass."""
+        get = session_state.get
+        return cls._make(get(k, d) for k, d in _SNAPSHOT_DEFAULTS.items())
+
+
+_SNAPSHOT_DEFAULTS: Final[dict[str, Any]] = SessionSnapshot()._asdict()
+
+
+@dataclass(slots=True)
 class ValidatedState:
     """Result of passing an AIDecision through the state engine.
 
@@ -85,29 +168,38 @@ def validate_transition(
     Returns:
         (approved_stage, list_of_warnings)
     """
-    warnings: list[str] = []
+    approved, warning = _check_transition(
+        current_stage, proposed_stage, happiness_score
+    )
+    return approved, [warning] if warning else []
 
+
+def _check_transition(
+    current_stage: NegotiationStage,
+    proposed_stage: NegotiationStage,
+    happiness_score: int,
+) -> tuple[NegotiationStage, Optional[str]]:
+    """Core of validate_transition() — at most one warning, no list."""
     # Staying in the same stage is always legal
     if proposed_stage == current_stage:
-        return proposed_stage, warnings
+        return proposed_stage, None
+
+    current_idx = _STAGE_IDX[current_stage]
 
     # Terminal stages cannot transition out
-    if current_stage in TERMINAL_STAGES:
-        warnings.append(
-            f"Cannot leave terminal stage {current_stage.value}. "
-            f"Proposed {proposed_stage.value} blocked."
-        )
-        return current_stage, warnings
+    if (_TERMINAL_MASK >> current_idx) & 1:
+        return current_stage, _WARN_TEMPLATES["terminal_exit"].format_map({
+            "current": current_stage.value,
+            "proposed": proposed_stage.value,
+        })
 
     # Check the transition graph
-    legal_targets = LEGAL_TRANSITIONS.get(current_stage, set())
-    if proposed_stage not in legal_targets:
-        warnings.append(
-            f"Illegal transition {current_stage.value} → {proposed_stage.value}. "
-            f"Legal targets: {sorted(s.value for s in legal_targets)}. "
-            f"Keeping {current_stage.value}."
-        )
-        return current_stage, warnings
+    if not (_LEGAL_MASK[current_idx] >> _STAGE_IDX[proposed_stage]) & 1:
+        return current_stage, _WARN_TEMPLATES["illegal_transition"].format_map({
+            "current": current_stage.value,
+            "proposed": proposed_stage.value,
+            "legal": _LEGAL_TARGET_STRS[current_idx],
+        })
 
     # Special rule: WALKAWAY → HAGGLING only if happiness_score > 40
     if (
@@ -115,13 +207,56 @@ def validate_transition(
         and proposed_stage == NegotiationStage.HAGGLING
         and happiness_score <= 40
     ):
-        warnings.append(
-            f"WALKAWAY → HAGGLING blocked: happiness_score={happiness_score} "
-            f"(must be > 40). Forcing CLOSURE."
-        )
-        return NegotiationStage.CLOSURE, warnings
+        return NegotiationStage.CLOSURE, _WARN_TEMPLATES[
+            "walkaway_blocked"
+        ].format_map({"happiness": happiness_score})
+
+    return proposed_stage, None
 
-    return proposed_stage, warnings
+
+def validate_transitions_batch(
+    currents: Sequence[NegotiationStage],
+    proposeds: Sequence[NegotiationStage],
+    happiness_scores: Sequence[int],
+) -> tuple[list[NegotiationStage], list[bool]]:
+    """Validate many transitions at once — for replay and offline testing.
+
+    Applies the same rules as validate_transition() straight off the
+    bitmask tables, without formatting warning messages.
+
+    Returns:
+        (approved_stages, overridden_flags) — one entry per input triple.
+
+    Raises:
+        ValueError: If the three sequences differ in length.
+    """
+    stage_idx = _STAGE_IDX
+    legal_mask = _LEGAL_MASK
+    terminal_mask = _TERMINAL_MASK
+    walkaway = NegotiationStage.WALKAWAY
+    haggling = NegotiationStage.HAGGLING
+    closure = NegotiationStage.CLOSURE
+
+    approved: list[NegotiationStage] = []
+    overridden: list[bool] = []
+    for current, proposed, happiness in zip(
+        currents, proposeds, happiness_scores, strict=True
+    ):
+        if proposed == current:
+            result = proposed
+        else:
+            idx = stage_idx[current]
+            if (terminal_mask >> idx) & 1 or not (
+                legal_mask[idx] >> stage_idx[proposed]
+            ) & 1:
+                result = current
+            elif current == walkaway and proposed == haggling and happiness <= 40:
+                result = closure
+            else:
+                result = proposed
+        approved.append(result)
+        overridden.append(result != proposed)
+    return approved, overridden
 
 
 # ═══════════════════════════════════════════════════════════
@@ -129,25 +264,35 @@ def validate_transition(
 # ═══════════════════════════════════════════════════════════
 
 
+def _compute_mood(happiness_score: int) -> VendorMood:
+    """Walk MOOD_THRESHOLDS for one score — evaluated once per table entry."""
+    for threshold, mood in MOOD_THRESHOLDS:
+        if happiness_score > threshold:
+            return mood
+    return VendorMood.ANGRY
+
+
+# One entry per possible score, indexed by (score - MOOD_MIN)
+_MOOD_TABLE: Final[tuple[VendorMood, ...]] = tuple(
+    _compute_mood(i) for i in range(MOOD_MIN, MOOD_MAX + 1)
+)
+
+
 def derive_vendor_mood(happiness_score: int) -> VendorMood:
     """Derive categorical VendorMood from numeric happiness.
 
-    Ranges (from enums.py docstring):
+    Ranges (from enums.MOOD_THRESHOLDS):
         happiness > 80  → enthusiastic
         happiness 61-80 → friendly
         happiness 41-60 → neutral
         happiness 21-40 → annoyed
         happiness ≤ 20  → angry
+
+    Out-of-range scores are clamped to [MOOD_MIN, MOOD_MAX] first.
     """
-    if happiness_score > 80:
-        return VendorMood.ENTHUSIASTIC
-    if happiness_score > 60:
-        return VendorMood.FRIENDLY
-    if happiness_score > 40:
-        return VendorMood.NEUTRAL
-    if happiness_score > 20:
-        return VendorMood.ANNOYED
-    return VendorMood.ANGRY
+    if not MOOD_MIN <= happiness_score <= MOOD_MAX:
+        happiness_score = min(max(happiness_score, MOOD_MIN), MOOD_MAX)
+    return _MOOD_TABLE[happiness_score - MOOD_MIN]
 
 
 def clamp_delta(
@@ -155,19 +300,32 @@ def clamp_delta(
 ) -> tuple[int, bool]:
     """Clamp a numeric value's change to ±max_delta from current.
 
+    The absolute [MOOD_MIN, MOOD_MAX] bounds and the per-turn delta are
+    merged into one allowed range. ``was_clamped`` is only True when the
+    delta bound (not the absolute bound) is what limited the value.
+
     Returns:
         (clamped_value, was_clamped)
     """
-    clamped = max(MOOD_MIN, min(MOOD_MAX, proposed))
-    delta = clamped - current
-    was_clamped = False
+    # Fast path: in range and within the delta — no min/max calls needed.
+    if (
+        MOOD_MIN <= proposed <= MOOD_MAX
+        and current - max_delta <= proposed <= current + max_delta
+    ):
+        return proposed, False
 
-    if abs(delta) > max_delta:
-        clamped = current + (max_delta if delta > 0 else -max_delta)
-        clamped = max(MOOD_MIN, min(MOOD_MAX, clamped))
-        was_clamped = True
+    if MOOD_MIN <= current <= MOOD_MAX:
+        lo = max(MOOD_MIN, current - max_delta)
+        hi = min(MOOD_MAX, current + max_delta)
+        if proposed < lo:
+            return lo, lo > MOOD_MIN
+        return hi, hi < MOOD_MAX
 
-    return clamped, was_clamped
+    # Out-of-range current (e.g. bad stored state): the merged window can
+    # invert, so step from current explicitly and clamp the result.
+    delta = min(max(proposed, MOOD_MIN), MOOD_MAX) - current
+    step = min(max(delta, -max_delta), max_delta)
+    return min(max(current + step, MOOD_MIN), MOOD_MAX), step != delta
 
 
 # ═══════════════════════════════════════════════════════════
@@ -177,7 +335,7 @@ def clamp_delta(
 
 def is_terminal_state(stage: NegotiationStage) -> bool:
     """Check if a negotiation stage is terminal (DEAL or CLOSURE)."""
-    return stage in TERMINAL_STAGES
+    return stage.is_terminal
 
 
 def build_session_summary(
@@ -185,10 +343,16 @@ def build_session_summary(
     stage: NegotiationStage,
     turn_count: int,
     happiness_score: int,
+    step: str = "session_terminal",
 ) -> dict[str, Any]:
-    """Build a structured summary for terminal-state logging."""
+    """Build a structured summary for terminal-state logging.
+
+    The ``step`` key is included so the dict can be passed to the logger
+    as ``extra`` directly, without copying it into a second dict.
+    """
     result = "won" if stage == NegotiationStage.DEAL else "ended"
     return {
+        "step": step,
         "session_id": session_id,
         "result": result,
         "final_stage": stage.value,
@@ -219,27 +383,36 @@ def validate_offer_happiness_consistency(
     Returns:
         (adjusted_happiness, list_of_warnings)
     """
-    warnings: list[str] = []
+    adjusted, warning = _check_offer(ai_decision, current_happiness)
+    return adjusted, [warning] if warning else []
+
+
+def _check_offer(
+    ai_decision: AIDecision,
+    current_happiness: int,
+) -> tuple[int, Optional[str]]:
+    """Core of validate_offer_happiness_consistency() — at most one warning."""
     proposed_happiness = ai_decision.happiness_score
     assessment = (ai_decision.offer_assessment or "none").lower()
 
     min_drop = _OFFER_MIN_DROPS.get(assessment, 0)
     if min_drop <= 0:
-        return proposed_happiness, warnings
+        return proposed_happiness, None
 
     actual_delta = current_happiness - proposed_happiness  # positive = drop
 
     if actual_delta < min_drop:
         # LLM was too lenient — enforce minimum drop
         forced_happiness = max(MOOD_MIN, current_happiness - min_drop)
-        warnings.append(
-            f"Offer assessed as '{assessment}' but happiness only dropped "
-            f"{actual_delta} (min required: {min_drop}). "
-            f"Forcing happiness: {proposed_happiness} → {forced_happiness}"
-        )
-        return forced_happiness, warnings
+        return forced_happiness, _WARN_TEMPLATES["offer_min_drop"].format_map({
+            "assessment": assessment,
+            "actual": actual_delta,
+            "min_drop": min_drop,
+            "proposed": proposed_happiness,
+            "forced": forced_happiness,
+        })
 
-    return proposed_happiness, warnings
+    return proposed_happiness, None
 
 
 def validate_price_direction(
@@ -254,25 +427,34 @@ def validate_price_direction(
     This is a soft validation — we log warnings but don't force a change,
     because the LLM might have a valid reason (e.g. switching items).
     """
-    warnings: list[str] = []
-    counter_price = ai_decision.counter_price
-    last_price = session_state.get("last_counter_price")
+    warning = _check_price_direction(
+        ai_decision.counter_price,
+        session_state.get("last_counter_price"),
+        session_state.get("negotiation_state", "GREETING"),
+    )
+    return [warning] if warning else []
+
 
+def _check_price_direction(
+    counter_price: Optional[int],
+    last_price: Optional[int],
+    current_stage: str,
+) -> Optional[str]:
+    """Core of validate_price_direction() — the warning, or None."""
     if counter_price is None or last_price is None:
-        return warnings
+        return None
 
-    current_stage = session_state.get("negotiation_state", "GREETING")
     # Allow price reset after WALKAWAY → HAGGLING re-entry
     if current_stage == "WALKAWAY":
-        return warnings
+        return None
 
     if counter_price > last_price:
-        warnings.append(
-            f"Vendor raised price from {last_price} to {counter_price}. "
-            f"Prices should only decrease during negotiation."
-        )
+        return _WARN_TEMPLATES["price_raised"].format_map({
+            "last": last_price,
+            "counter": counter_price,
+        })
 
-    return warnings
+    return None
 
 
 # ═══════════════════════════════════════════════════════════
@@ -282,9 +464,22 @@ def validate_price_direction(
 
 def validate_ai_decision(
     ai_decision: AIDecision,
-    session_state: dict[str, Any],
+    session_state: Union[SessionSnapshot, dict[str, Any]],
     *,
     max_mood_delta: int = MAX_MOOD_DELTA,
+    # Hot-path bindings: default args resolve once at def time and are
+    # read as locals. Not part of the public API — never pass these.
+    _check_transition: Any = _check_transition,
+    _check_offer: Any = _check_offer,
+    _check_price: Any = _check_price_direction,
+    _clamp: Any = clamp_delta,
+    _derive_mood: Any = derive_vendor_mood,
+    _is_terminal: Any = is_terminal_state,
+    _build_summary: Any = build_session_summary,
+    _stage_by_value: dict[str, NegotiationStage] = _STAGE_BY_VALUE,
+    _templates: dict[str, str] = _WARN_TEMPLATES,
+    _GREETING: NegotiationStage = NegotiationStage.GREETING,
+    _logger: logging.Logger = logger,
 ) -> ValidatedState:
     """Validate and clamp the AI's proposed state changes.
 
@@ -301,7 +496,8 @@ def validate_ai_decision(
 
     Args:
         ai_decision: Raw proposal from the AI brain.
-        session_state: Authoritative state from Neo4j / session store.
+        session_state: Authoritative state from Neo4j / session store,
+            either the raw dict or a SessionSnapshot.
         max_mood_delta: Per-turn clamp (default from config).
 
     Returns:
@@ -309,82 +505,86 @@ def validate_ai_decision(
     """
     warnings: list[str] = []
 
-    # Current authoritative values
-    current_happiness = session_state.get("happiness_score", 50)
-    current_stage_str = session_state.get("negotiation_state", "GREETING")
-
-    try:
-        current_stage = NegotiationStage(current_stage_str)
-    except ValueError:
-        current_stage = NegotiationStage.GREETING
-        warnings.append(
-            f"Invalid current stage '{current_stage_str}' in session — "
-            f"defaulting to GREETING."
-        )
+    # Current authoritative values — one conversion, then attribute reads
+    snap = (
+        session_state
+        if isinstance(session_state, SessionSnapshot)
+        else SessionSnapshot.from_state(session_state)
+    )
+    current_happiness = snap.happiness_score
+    current_stage_str = snap.negotiation_state
+
+    current_stage = _stage_by_value.get(current_stage_str)
+    if current_stage is None:
+        current_stage = _GREETING
+        warnings.append(_templates["invalid_stage"].format_map({
+            "stage": current_stage_str,
+        }))
 
     # ── 1. Stage transition ───────────────────────────
     proposed_stage = ai_decision.negotiation_state
-    approved_stage, stage_warnings = validate_transition(
+    approved_stage, stage_warning = _check_transition(
         current_stage, proposed_stage, ai_decision.happiness_score
     )
-    warnings.extend(stage_warnings)
+    if stage_warning:
+        warnings.append(stage_warning)
 
     # ── 2. Offer-happiness consistency (v6.0) ─────────
     # If the LLM assessed an offer as "insult" or "lowball" but didn't
     # drop happiness enough, force a minimum drop BEFORE clamping.
-    adjusted_happiness, offer_warnings = validate_offer_happiness_consistency(
+    adjusted_happiness, offer_warning = _check_offer(
         ai_decision, current_happiness
     )
-    warnings.extend(offer_warnings)
+    if offer_warning:
+        warnings.append(offer_warning)
 
     # Use the adjusted happiness for clamping (may have been forced down)
     happiness_for_clamping = adjusted_happiness
 
     # ── 3. Clamp happiness_score ─────────────────────
-    clamped_happiness, was_clamped = clamp_delta(
+    clamped_happiness, was_clamped = _clamp(
         current_happiness, happiness_for_clamping, max_mood_delta
     )
     if was_clamped:
-        warnings.append(
-            f"happiness_score clamped: {happiness_for_clamping} → "
-            f"{clamped_happiness} (current={current_happiness}, "
-            f"max_delta=±{max_mood_delta})"
-        )
+        warnings.append(_templates["happiness_clamped"].format_map({
+            "proposed": happiness_for_clamping,
+            "clamped": clamped_happiness,
+            "current": current_happiness,
+            "max_delta": max_mood_delta,
+        }))
 
     # ── 4. Price direction validation (v6.0) ──────────
-    price_warnings = validate_price_direction(ai_decision, session_state)
-    warnings.extend(price_warnings)
+    price_warning = _check_price(
+        ai_decision.counter_price, snap.last_counter_price, current_stage_str
+    )
+    if price_warning:
+        warnings.append(price_warning)
 
     # ── 5. Derive vendor_mood from happiness ──────────
-    derived_mood = derive_vendor_mood(clamped_happiness)
+    derived_mood = _derive_mood(clamped_happiness)
 
     # ── 6. Terminal state detection ───────────────────
-    terminal = is_terminal_state(approved_stage)
+    terminal = _is_terminal(approved_stage)
 
-    # ── Log warnings ──────────────────────────────────
-    for w in warnings:
-        logger.warning(
-            "State engine override",
+    # ── Log warnings (one record for all overrides) ───
+    if warnings and _logger.isEnabledFor(logging.WARNING):
+        _logger.warning(
+            "State engine overrides",
             extra={
                 "step": "state_validation",
-                "warning": w,
+                "warnings": warnings,
+                "count": len(warnings),
             },
         )
 
     if terminal:
-        summary = build_session_summary(
-            session_id=session_state.get("session_id", "unknown"),
+        summary = _build_summary(
+            session_id=snap.session_id,
             stage=approved_stage,
-            turn_count=session_state.get("turn_count", 0),
+            turn_count=snap.turn_count,
             happiness_score=clamped_happiness,
         )
-        logger.info(
-            "Terminal state reached",
-            extra={
-                "step": "session_terminal",
-                **summary,
-            },
-        )
+        _logger.info("Terminal state reached", extra=summary)
 
     return ValidatedState(
         reply_text=ai_decision.reply_text,
@@ -396,3 +596,16 @@ def validate_ai_decision(
         warnings=warnings,
         is_terminal=terminal,
     )
+
+
+@lru_cache(maxsize=None)
+def make_validator(
+    max_mood_delta: int = MAX_MOOD_DELTA,
+) -> Callable[..., ValidatedState]:
+    """Return validate_ai_decision with ``max_mood_delta`` pre-bound.
+
+    Cached per delta value, so calling make_validator(settings.max_mood_delta)
+    on every turn hands back the same callable. Call it as
+    ``validator(ai_decision, session_state)``.
+    """
+    return partial(validate_ai_decision, max_mood_delta=max_mood_delta)
@@ -6,11 +6,17 @@ Provides common mock service setup and environment overrides.
 
 from __future__ import annotations
 
+import asyncio
 import os
 from typing import Generator
 
 import pytest
 
+try:
+    import uvloop
+except ImportError:  # uvicorn[standard] skips uvloop on Windows
+    uvloop = None
+
 from app.dependencies import override_llm_service, override_session_store, reset_services
 from app.services.mocks import MockLLMService, MockSessionStore
 
@@ -31,6 +37,15 @@ def _mock_env(request, monkeypatch: pytest.MonkeyPatch) -> Generator[None, None,
     reset_services()
 
 
+@pytest.fixture(autouse=True)
+def _no_mock_llm_latency(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Skip MockLLMService's simulated API latency in every test.
+
+    test_simulates_latency sets it back locally.
+    """
+    monkeypatch.setattr(MockLLMService, "simulated_latency_s", 0.0)
+
+
 @pytest.fixture()
 def mock_llm() -> MockLLMService:
     """Provide a fresh MockLLMService and wire it into DI."""
@@ -45,3 +60,13 @@ def mock_store() -> MockSessionStore:
     store = MockSessionStore()
     override_session_store(store)
     return store
+
+
+def pytest_asyncio_loop_factories(config, item) -> dict:
+    """Run async tests on uvloop, the loop uvicorn[standard] serves with.
+
+    Falls back to the stdlib loop where uvloop isn't installed (Windows).
+    """
+    if uvloop is None:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
@@ -0,0 +1,24 @@
+"""
+Shared test helpers (plain functions — fixtures live in conftest.py).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# A valid scene_context as Unity sends it; tests override single fields.
+SCENE_BASE: dict[str, Any] = {
+    "object_grabbed": "silk_scarf",
+    "happiness_score": 55,
+    "negotiation_state": "INQUIRY",
+    "input_language": "en-IN",
+    "target_language": "en-IN",
+}
+
+
+def make_scene(**overrides: object) -> dict[str, Any]:
+    """Build a valid scene_context dict with optional overrides.
+
+    Always a fresh copy of SCENE_BASE, so callers may mutate the result.
+    """
+    return {**SCENE_BASE, **overrides}
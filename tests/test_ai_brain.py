@@ -12,8 +12,9 @@ All tests use mocks for the OpenAI API — no real API calls are made.
 
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Any
+from typing import Any, Iterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -30,12 +31,15 @@ from app.prompts.vendor_system import (
     OUTPUT_SCHEMA,
     PERSONA,
     PROMPT_VERSION,
+    PROMPT_VERSION_PARTS,
     STATE_TRANSITION_RULES,
+    STATIC_PREFIX,
     build_system_prompt,
     build_user_message,
 )
 from app.services.ai_brain import OpenAILLMService, _FALLBACK_DECISION
 from app.services.mocks import MockLLMService, MockSessionStore
+from tests.helpers import make_scene
 
 
 # ═══════════════════════════════════════════════════════════
@@ -58,17 +62,32 @@ def mock_llm() -> MockLLMService:
     return service
 
 
-def _scene(**overrides: Any) -> dict[str, Any]:
-    """Build a default scene_context dict with optional overrides."""
-    base = {
-        "object_grabbed": "silk_scarf",
-        "happiness_score": 55,
-        "negotiation_state": "INQUIRY",
-        "input_language": "en-IN",
-        "target_language": "en-IN",
-    }
-    base.update(overrides)
-    return base
+# Settings seen by OpenAILLMService in these tests — built once, shared
+# by every patch of app.services.ai_brain.get_settings
+_TEST_SETTINGS = MagicMock(
+    openai_api_key="sk-test",
+    ai_timeout_ms=10000,
+    openai_model="gpt-4o",
+    ai_temperature=0.7,
+    ai_max_tokens=200,
+)
+
+
+@pytest.fixture()
+def openai_service_with_mock_client() -> Iterator[tuple[OpenAILLMService, AsyncMock]]:
+    """Provide an OpenAILLMService whose chat.completions.create is an AsyncMock.
+
+    Backoff sleeps are patched out for the duration of the test.
+    """
+    with patch("app.services.ai_brain.get_settings", return_value=_TEST_SETTINGS):
+        service = OpenAILLMService()
+
+    create = AsyncMock()
+    service._client = MagicMock()
+    service._client.chat.completions.create = create
+
+    with patch("app.services.ai_brain.asyncio.sleep", new_callable=AsyncMock):
+        yield service, create
 
 
 # ═══════════════════════════════════════════════════════════
@@ -167,6 +186,36 @@ class TestBuildSystemPrompt:
         assert "WALKAWAY" in prompt
         assert "CLOSURE" in prompt
 
+    def test_static_prefix_comes_first(self) -> None:
+        """Every prompt starts with the same static prefix, whatever the state."""
+        prompts = [
+            build_system_prompt(
+                happiness_score=50,
+                negotiation_state="GREETING",
+                turn_count=1,
+            ),
+            build_system_prompt(
+                happiness_score=12,
+                negotiation_state="HAGGLING",
+                turn_count=27,
+                object_grabbed="brass_lamp",
+                wrap_up=True,
+                graph_context="## Conversation Graph Context",
+            ),
+        ]
+        for prompt in prompts:
+            assert prompt.startswith(STATIC_PREFIX)
+            assert "## Current Game State" not in STATIC_PREFIX
+
+    def test_identical_state_reuses_prompt(self) -> None:
+        """Repeated calls with the same state return the cached string."""
+        kwargs = {
+            "happiness_score": 64,
+            "negotiation_state": "HAGGLING",
+            "turn_count": 3,
+        }
+        assert build_system_prompt(**kwargs) is build_system_prompt(**kwargs)
+
 
 class TestBuildUserMessage:
     """Tests for build_user_message() — the user turn assembler."""
@@ -235,10 +284,10 @@ class TestPromptVersion:
         assert len(PROMPT_VERSION) > 0
 
     def test_prompt_version_format(self) -> None:
-        """PROMPT_VERSION follows semver-like pattern."""
-        parts = PROMPT_VERSION.split(".")
-        assert len(parts) >= 2
-        assert all(p.isdigit() for p in parts)
+        """PROMPT_VERSION follows semver-like pattern, pre-parsed at import."""
+        assert len(PROMPT_VERSION_PARTS) >= 2
+        assert all(part >= 0 for part in PROMPT_VERSION_PARTS)
+        assert ".".join(map(str, PROMPT_VERSION_PARTS)) == PROMPT_VERSION
 
 
 # ═══════════════════════════════════════════════════════════
@@ -305,143 +354,166 @@ class TestOpenAILLMServiceParsing:
             OpenAILLMService._parse_response('{"reply_text": "hello"}')
 
 
+class TestOpenAILLMServiceClient:
+    """Tests for lazy construction of the OpenAI client."""
+
+    def test_client_built_on_first_access(self) -> None:
+        """AsyncOpenAI is only constructed when _client is first used."""
+        with patch(
+            "app.services.ai_brain.get_settings", return_value=_TEST_SETTINGS
+        ), patch("app.services.ai_brain.AsyncOpenAI") as mock_openai:
+            service = OpenAILLMService()
+            mock_openai.assert_not_called()
+
+            assert service._client is service._client
+            mock_openai.assert_called_once_with(
+                api_key="sk-test", timeout=10.0, max_retries=0
+            )
+
+
 class TestOpenAILLMServiceRetry:
     """Tests for retry and fallback behavior of OpenAILLMService."""
 
-    @pytest.mark.asyncio
-    async def test_successful_call(self) -> None:
+    async def test_successful_call(
+        self, openai_service_with_mock_client: tuple[OpenAILLMService, AsyncMock]
+    ) -> None:
         """Happy path — first call succeeds."""
-        with patch("app.services.ai_brain.get_settings") as mock_settings:
-            mock_settings.return_value = MagicMock(
-                openai_api_key="sk-test",
-                ai_timeout_ms=10000,
-                openai_model="gpt-4o",
-                ai_temperature=0.7,
-                ai_max_tokens=200,
-            )
-            service = OpenAILLMService()
-
-        mock_response = _make_openai_response(_valid_ai_response())
-        service._client = MagicMock()
-        service._client.chat = MagicMock()
-        service._client.chat.completions = MagicMock()
-        service._client.chat.completions.create = AsyncMock(return_value=mock_response)
+        service, create = openai_service_with_mock_client
+        create.return_value = _make_openai_response(_valid_ai_response())
 
         result = await service.generate_decision("system prompt", "user msg")
         assert isinstance(result, AIDecision)
         assert result.negotiation_state == NegotiationStage.HAGGLING
-        service._client.chat.completions.create.assert_awaited_once()
+        create.assert_awaited_once()
 
-    @pytest.mark.asyncio
-    async def test_retry_on_transient_error(self) -> None:
+    async def test_retry_on_transient_error(
+        self, openai_service_with_mock_client: tuple[OpenAILLMService, AsyncMock]
+    ) -> None:
         """Retries on APITimeoutError then succeeds."""
         from openai import APITimeoutError
 
-        with patch("app.services.ai_brain.get_settings") as mock_settings:
-            mock_settings.return_value = MagicMock(
-                openai_api_key="sk-test",
-                ai_timeout_ms=10000,
-                openai_model="gpt-4o",
-                ai_temperature=0.7,
-                ai_max_tokens=200,
-            )
-            service = OpenAILLMService()
-
-        mock_response = _make_openai_response(_valid_ai_response())
-        service._client = MagicMock()
-        service._client.chat = MagicMock()
-        service._client.chat.completions = MagicMock()
-        service._client.chat.completions.create = AsyncMock(
-            side_effect=[
-                APITimeoutError(request=MagicMock()),
-                mock_response,
-            ]
-        )
+        service, create = openai_service_with_mock_client
+        create.side_effect = [
+            APITimeoutError(request=MagicMock()),
+            _make_openai_response(_valid_ai_response()),
+        ]
 
-        # Patch sleep to avoid real waiting
-        with patch("app.services.ai_brain.asyncio.sleep", new_callable=AsyncMock):
-            result = await service.generate_decision("system prompt", "user msg")
+        result = await service.generate_decision("system prompt", "user msg")
 
         assert isinstance(result, AIDecision)
-        assert service._client.chat.completions.create.await_count == 2
+        assert create.await_count == 2
 
-    @pytest.mark.asyncio
-    async def test_fallback_after_all_retries_exhausted(self) -> None:
+    async def test_fallback_after_all_retries_exhausted(
+        self, openai_service_with_mock_client: tuple[OpenAILLMService, AsyncMock]
+    ) -> None:
         """Returns fallback decision after all retries fail."""
         from openai import APITimeoutError
 
-        with patch("app.services.ai_brain.get_settings") as mock_settings:
-            mock_settings.return_value = MagicMock(
-                openai_api_key="sk-test",
-                ai_timeout_ms=10000,
-                openai_model="gpt-4o",
-                ai_temperature=0.7,
-                ai_max_tokens=200,
-            )
-            service = OpenAILLMService()
-
-        service._client = MagicMock()
-        service._client.chat = MagicMock()
-        service._client.chat.completions = MagicMock()
-        service._client.chat.completions.create = AsyncMock(
-            side_effect=APITimeoutError(request=MagicMock())
-        )
+        service, create = openai_service_with_mock_client
+        create.side_effect = APITimeoutError(request=MagicMock())
 
-        with patch("app.services.ai_brain.asyncio.sleep", new_callable=AsyncMock):
-            result = await service.generate_decision("system prompt", "user msg")
+        result = await service.generate_decision("system prompt", "user msg")
 
         # Should get the fallback response
         assert result.internal_reasoning.startswith("[FALLBACK]")
-        assert service._client.chat.completions.create.await_count == 3  # 1 + 2 retries
+        assert create.await_count == 3  # 1 + 2 retries
 
-    @pytest.mark.asyncio
-    async def test_fallback_on_persistent_parse_failure(self) -> None:
-        """Returns fallback when JSON parsing fails on every attempt."""
-        with patch("app.services.ai_brain.get_settings") as mock_settings:
-            mock_settings.return_value = MagicMock(
-                openai_api_key="sk-test",
-                ai_timeout_ms=10000,
-                openai_model="gpt-4o",
-                ai_temperature=0.7,
-                ai_max_tokens=200,
-            )
-            service = OpenAILLMService()
+    async def test_backoff_sleeps_bounded_by_timeout(
+        self, openai_service_with_mock_client: tuple[OpenAILLMService, AsyncMock]
+    ) -> None:
+        """Total backoff never exceeds the AI_TIMEOUT_MS budget."""
+        from openai import APITimeoutError
+
+        service, create = openai_service_with_mock_client
+        service._timeout_s = 1.5
+        create.side_effect = APITimeoutError(request=MagicMock())
+
+        with patch(
+            "app.services.ai_brain.asyncio.sleep", new_callable=AsyncMock
+        ) as sleep:
+            await service.generate_decision("system prompt", "user msg")
+
+        total_sleep = sum(call.args[0] for call in sleep.await_args_list)
+        assert total_sleep <= 1.5
+        for call in create.await_args_list:
+            assert call.kwargs["timeout"] <= 1.5
 
-        bad_response = _make_openai_response("I am not valid JSON at all!")
-        service._client = MagicMock()
-        service._client.chat = MagicMock()
-        service._client.chat.completions = MagicMock()
-        service._client.chat.completions.create = AsyncMock(return_value=bad_response)
+    async def test_hanging_call_bounded_by_total_budget(
+        self, openai_service_with_mock_client: tuple[OpenAILLMService, AsyncMock]
+    ) -> None:
+        """A call that never answers cannot outlive AI_TIMEOUT_MS."""
+        service, create = openai_service_with_mock_client
+        service._timeout_s = 0.2
 
-        with patch("app.services.ai_brain.asyncio.sleep", new_callable=AsyncMock):
-            result = await service.generate_decision("system prompt", "user msg")
+        async def _hang(**kwargs: Any) -> Any:
+            await asyncio.Event().wait()
 
+        create.side_effect = _hang
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        result = await service.generate_decision("system prompt", "user msg")
+
+        assert loop.time() - start < 0.5
         assert result.internal_reasoning.startswith("[FALLBACK]")
+        create.assert_awaited_once()
+
+    async def test_exhausted_budget_skips_call(
+        self, openai_service_with_mock_client: tuple[OpenAILLMService, AsyncMock]
+    ) -> None:
+        """With no time budget left, the fallback is returned without a call."""
+        service, create = openai_service_with_mock_client
+        service._timeout_s = 0
+
+        result = await service.generate_decision("system prompt", "user msg")
 
-    @pytest.mark.asyncio
-    async def test_non_retryable_error_raises(self) -> None:
+        assert result.internal_reasoning.startswith("[FALLBACK]")
+        create.assert_not_awaited()
+
+    async def test_fallback_on_persistent_parse_failure(
+        self, openai_service_with_mock_client: tuple[OpenAILLMService, AsyncMock]
+    ) -> None:
+        """Returns fallback when JSON parsing fails on every attempt."""
+        service, create = openai_service_with_mock_client
+        create.return_value = _make_openai_response("I am not valid JSON at all!")
+
+        result = await service.generate_decision("system prompt", "user msg")
+
+        assert result.internal_reasoning.startswith("[FALLBACK]")
+
+    async def test_session_id_passed_as_user(
+        self, openai_service_with_mock_client: tuple[OpenAILLMService, AsyncMock]
+    ) -> None:
+        """session_id is sent as OpenAI's ``user`` field for cache routing."""
+        service, create = openai_service_with_mock_client
+        create.return_value = _make_openai_response(_valid_ai_response())
+
+        await service.generate_decision(
+            "system prompt", "user msg", session_id="sess-42"
+        )
+        assert create.call_args.kwargs["user"] == "sess-42"
+
+    async def test_user_omitted_without_session_id(
+        self, openai_service_with_mock_client: tuple[OpenAILLMService, AsyncMock]
+    ) -> None:
+        """No ``user`` field is sent when the session is unknown."""
+        service, create = openai_service_with_mock_client
+        create.return_value = _make_openai_response(_valid_ai_response())
+
+        await service.generate_decision("system prompt", "user msg")
+        assert "user" not in create.call_args.kwargs
+
+    async def test_non_retryable_error_raises(
+        self, openai_service_with_mock_client: tuple[OpenAILLMService, AsyncMock]
+    ) -> None:
         """Non-retryable errors raise BrainServiceError immediately."""
         from openai import AuthenticationError
 
-        with patch("app.services.ai_brain.get_settings") as mock_settings:
-            mock_settings.return_value = MagicMock(
-                openai_api_key="sk-test",
-                ai_timeout_ms=10000,
-                openai_model="gpt-4o",
-                ai_temperature=0.7,
-                ai_max_tokens=200,
-            )
-            service = OpenAILLMService()
-
-        service._client = MagicMock()
-        service._client.chat = MagicMock()
-        service._client.chat.completions = MagicMock()
-        service._client.chat.completions.create = AsyncMock(
-            side_effect=AuthenticationError(
-                message="Invalid API key",
-                response=MagicMock(status_code=401),
-                body=None,
-            )
+        service, create = openai_service_with_mock_client
+        create.side_effect = AuthenticationError(
+            message="Invalid API key",
+            response=MagicMock(status_code=401),
+            body=None,
         )
 
         with pytest.raises(BrainServiceError, match="LLM call failed"):
@@ -477,20 +549,18 @@ class TestFallbackDecision:
 class TestGenerateWithGodPrompt:
     """Integration: generate_vendor_response() uses the God Prompt system."""
 
-    @pytest.mark.asyncio
     async def test_greeting_flow(self, mock_llm: MockLLMService, mock_store: MockSessionStore) -> None:
         """Greeting text triggers greeting response via mock LLM."""
         result = await generate_vendor_response(
             transcribed_text="Namaste bhaiya!",
             context_block="",
             rag_context="",
-            scene_context=_scene(negotiation_state="GREETING"),
+            scene_context=make_scene(negotiation_state="GREETING"),
             session_id="test-greeting",
         )
         assert result["reply_text"]
         assert "happiness_score" in result
 
-    @pytest.mark.asyncio
     async def test_haggling_flow(self, mock_llm: MockLLMService, mock_store: MockSessionStore) -> None:
         """Price query triggers inquiry response."""
         # Pre-populate at INQUIRY so INQUIRY → HAGGLING is legal
@@ -505,26 +575,24 @@ class TestGenerateWithGodPrompt:
             transcribed_text="Yeh kitne ka hai bhai?",
             context_block="[Turn 1] User: Namaste bhaiya!",
             rag_context="Silk Scarf: Wholesale ₹150, Fair Retail ₹300-400.",
-            scene_context=_scene(negotiation_state="INQUIRY"),
+            scene_context=make_scene(negotiation_state="INQUIRY"),
             session_id="test-haggling",
         )
         assert result["negotiation_state"] in ("HAGGLING", "INQUIRY")
 
-    @pytest.mark.asyncio
     async def test_session_state_persisted(self, mock_llm: MockLLMService, mock_store: MockSessionStore) -> None:
         """Session state is persisted after a successful call."""
         await generate_vendor_response(
             transcribed_text="Namaste!",
             context_block="",
             rag_context="",
-            scene_context=_scene(),
+            scene_context=make_scene(),
             session_id="persist-test",
         )
         state = await mock_store.load_session("persist-test")
         assert state is not None
         assert state["turn_count"] == 1
 
-    @pytest.mark.asyncio
     async def test_wrap_up_at_threshold(self, mock_llm: MockLLMService, mock_store: MockSessionStore) -> None:
         """At turn threshold, wrap-up is passed via system prompt (mock still works)."""
         # Pre-create session at turn 24 (will become 25)
@@ -537,31 +605,29 @@ class TestGenerateWithGodPrompt:
             transcribed_text="Kitne ka final?",
             context_block="",
             rag_context="",
-            scene_context=_scene(negotiation_state="HAGGLING"),
+            scene_context=make_scene(negotiation_state="HAGGLING"),
             session_id="wrap-test",
         )
         assert result["reply_text"]
 
-    @pytest.mark.asyncio
     async def test_rag_context_flows_through(self, mock_llm: MockLLMService, mock_store: MockSessionStore) -> None:
         """RAG context reaches the LLM via the user message (mock still works)."""
         result = await generate_vendor_response(
             transcribed_text="Tell me about this scarf",
             context_block="",
             rag_context="Banarasi silk, handwoven, wholesale ₹150",
-            scene_context=_scene(),
+            scene_context=make_scene(),
             session_id="rag-test",
         )
         assert result["reply_text"]  # Mock returns browsing response
 
-    @pytest.mark.asyncio
     async def test_empty_rag_context_ok(self, mock_llm: MockLLMService, mock_store: MockSessionStore) -> None:
         """Empty RAG context is handled gracefully."""
         result = await generate_vendor_response(
             transcribed_text="Hello bhai",
             context_block="",
             rag_context="",
-            scene_context=_scene(),
+            scene_context=make_scene(),
             session_id="empty-rag-test",
         )
         assert result["reply_text"]
@@ -621,7 +687,6 @@ class TestPromptInjection:
 class TestMockSpeechExtraction:
     """Verify mock LLM correctly extracts speech from new prompt format."""
 
-    @pytest.mark.asyncio
     async def test_mock_extracts_from_delimited_format(self) -> None:
         """Mock extracts user speech from --- USER MESSAGE --- delimiters."""
         llm = MockLLMService()
@@ -634,7 +699,6 @@ class TestMockSpeechExtraction:
         # Should match "namaste" keyword, not false positive on "price"
         assert result.negotiation_state == NegotiationStage.GREETING
 
-    @pytest.mark.asyncio
     async def test_mock_no_false_positive_from_context(self) -> None:
         """Mock doesn't match keywords from context/RAG sections."""
         llm = MockLLMService()
@@ -647,7 +711,6 @@ class TestMockSpeechExtraction:
         # "Aur dikhao kuch" has no keywords → default GREETING
         assert result.negotiation_state == NegotiationStage.GREETING
 
-    @pytest.mark.asyncio
     async def test_mock_legacy_format_still_works(self) -> None:
         """Mock still handles the old 'User says:' format for backward compat."""
         llm = MockLLMService()
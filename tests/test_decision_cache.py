@@ -0,0 +1,103 @@
+"""
+LLM decision cache tests.
+
+Coverage:
+    - Hits skip the inner LLM call and are tagged [CACHE]
+    - User-text normalisation (case, whitespace)
+    - Fallback decisions are never cached
+    - TTL expiry and LRU eviction
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.models.enums import NegotiationStage, VendorMood
+from app.models.response import AIDecision
+from app.services.decision_cache import CachingLLMService
+from app.services.protocols import LLMService
+
+
+def _make_decision(**overrides: object) -> AIDecision:
+    """Helper to build an AIDecision with sensible defaults."""
+    defaults = {
+        "reply_text": "Aao bhaiya!",
+        "happiness_score": 55,
+        "negotiation_state": NegotiationStage.INQUIRY,
+        "vendor_mood": VendorMood.NEUTRAL,
+        "internal_reasoning": "test",
+        "suggested_user_response": "How much is this?",
+    }
+    defaults.update(overrides)
+    return AIDecision(**defaults)
+
+
+@pytest.fixture
+def inner() -> MagicMock:
+    mock = MagicMock()
+    mock.generate_decision = AsyncMock(return_value=_make_decision())
+    return mock
+
+
+class TestCachingLLMService:
+    """CachingLLMService — wraps an LLMService with a TTL/LRU cache."""
+
+    def test_is_llm_service(self, inner: MagicMock) -> None:
+        assert isinstance(CachingLLMService(inner), LLMService)
+
+    async def test_hit_skips_inner_call(self, inner: MagicMock) -> None:
+        cache = CachingLLMService(inner)
+        first = await cache.generate_decision("sys", "Namaste")
+        second = await cache.generate_decision("sys", "Namaste")
+        assert inner.generate_decision.await_count == 1
+        assert first.internal_reasoning == "test"
+        assert second.internal_reasoning == "[CACHE] test"
+        assert second.reply_text == first.reply_text
+
+    async def test_session_id_forwarded(self, inner: MagicMock) -> None:
+        cache = CachingLLMService(inner)
+        await cache.generate_decision("sys", "Namaste", session_id="sess-1")
+        assert inner.generate_decision.call_args.kwargs["session_id"] == "sess-1"
+
+    async def test_user_text_is_normalised(self, inner: MagicMock) -> None:
+        cache = CachingLLMService(inner)
+        await cache.generate_decision("sys", "Kitne ka hai?")
+        await cache.generate_decision("sys", "  kitne   KA hai? ")
+        assert inner.generate_decision.await_count == 1
+
+    async def test_different_system_prompt_misses(self, inner: MagicMock) -> None:
+        cache = CachingLLMService(inner)
+        await cache.generate_decision("happiness: 50", "Namaste")
+        await cache.generate_decision("happiness: 60", "Namaste")
+        assert inner.generate_decision.await_count == 2
+
+    async def test_fallback_not_cached(self, inner: MagicMock) -> None:
+        inner.generate_decision.return_value = _make_decision(
+            internal_reasoning="[FALLBACK] timeout"
+        )
+        cache = CachingLLMService(inner)
+        await cache.generate_decision("sys", "Namaste")
+        await cache.generate_decision("sys", "Namaste")
+        assert inner.generate_decision.await_count == 2
+
+    async def test_expired_entry_misses(self, inner: MagicMock) -> None:
+        cache = CachingLLMService(inner, ttl_s=10.0)
+        with patch("app.services.decision_cache.time.monotonic", return_value=100.0):
+            await cache.generate_decision("sys", "Namaste")
+        with patch("app.services.decision_cache.time.monotonic", return_value=111.0):
+            await cache.generate_decision("sys", "Namaste")
+        assert inner.generate_decision.await_count == 2
+
+    async def test_lru_eviction(self, inner: MagicMock) -> None:
+        cache = CachingLLMService(inner, max_entries=2)
+        await cache.generate_decision("sys", "a")
+        await cache.generate_decision("sys", "b")
+        await cache.generate_decision("sys", "a")  # refresh "a"
+        await cache.generate_decision("sys", "c")  # evicts "b"
+        assert inner.generate_decision.await_count == 3
+        await cache.generate_decision("sys", "a")
+        assert inner.generate_decision.await_count == 3
+        await cache.generate_decision("sys", "b")
+        assert inner.generate_decision.await_count == 4
@@ -12,7 +12,8 @@ Coverage:
 from __future__ import annotations
 
 import asyncio
-import time
+from typing import Iterator
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -23,10 +24,13 @@ from app.dependencies import (
     override_session_store,
     reset_services,
 )
+from app.exceptions import StateStoreError
+from app.generate import generate_vendor_response
 from app.models.enums import NegotiationStage, VendorMood
 from app.models.response import AIDecision, VendorResponse
 from app.services.mocks import MockLLMService, MockSessionStore
 from app.services.protocols import LLMService, SessionStore
+from tests.helpers import make_scene
 
 
 # ═══════════════════════════════════════════════════════════
@@ -52,9 +56,11 @@ class TestProtocolConformance:
 class TestMockLLMService:
     """MockLLMService — deterministic keyword-routed responses."""
 
-    @pytest.fixture(autouse=True)
-    def _setup(self) -> None:
-        self.llm = MockLLMService()
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def _setup(cls) -> None:
+        # Stateless — one instance serves the whole class.
+        cls.llm = MockLLMService()
 
     async def test_greeting_namaste(self) -> None:
         decision = await self.llm.generate_decision("system", "Namaste bhaiya!")
@@ -119,12 +125,12 @@ class TestMockLLMService:
             assert isinstance(decision, AIDecision)
             assert 0 <= decision.happiness_score <= 100
 
-    async def test_simulates_latency(self) -> None:
-        """Mock should take ~200ms to simulate real API latency."""
-        start = time.monotonic()
-        await self.llm.generate_decision("system", "test")
-        elapsed = time.monotonic() - start
-        assert elapsed >= 0.15, f"Expected ≥150ms, got {elapsed*1000:.0f}ms"
+    async def test_simulates_latency(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Mock should sleep for simulated_latency_s to mimic API latency."""
+        monkeypatch.setattr(MockLLMService, "simulated_latency_s", 0.2)
+        with patch("app.services.mocks.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await self.llm.generate_decision("system", "test")
+        sleep.assert_awaited_once_with(0.2)
 
     async def test_internal_reasoning_populated(self) -> None:
         decision = await self.llm.generate_decision("system", "Namaste!")
@@ -146,9 +152,15 @@ class TestMockLLMService:
 class TestMockSessionStore:
     """MockSessionStore — in-memory dict-based session storage."""
 
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def _setup(cls) -> None:
+        cls.store = MockSessionStore()
+
     @pytest.fixture(autouse=True)
-    def _setup(self) -> None:
-        self.store = MockSessionStore()
+    def _clear(self) -> Iterator[None]:
+        yield
+        self.store.clear()
 
     async def test_create_session_returns_defaults(self) -> None:
         state = await self.store.create_session("sess-1")
@@ -215,6 +227,15 @@ class TestMockSessionStore:
         assert loaded is not None
         assert loaded["turn_count"] == 0  # original untouched
 
+    async def test_seed_overlays_defaults(self) -> None:
+        self.store.seed("seeded", negotiation_state="DEAL", turn_count=7)
+        state = await self.store.load_session("seeded")
+        assert state is not None
+        assert state["session_id"] == "seeded"
+        assert state["negotiation_state"] == "DEAL"
+        assert state["turn_count"] == 7
+        assert state["happiness_score"] == 50
+
     async def test_clear(self) -> None:
         await self.store.create_session("x")
         await self.store.create_session("y")
@@ -300,6 +321,18 @@ class TestDependencyInjection:
         service = get_llm_service()
         assert isinstance(service, OpenAILLMService)
 
+    def test_llm_cache_wraps_real_llm_service(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """LLM_CACHE_MAX_ENTRIES>0 wraps OpenAILLMService in the decision cache."""
+        reset_services()
+        monkeypatch.setenv("USE_MOCKS", "false")
+        monkeypatch.setenv("LLM_CACHE_MAX_ENTRIES", "100")
+        from app.services.decision_cache import CachingLLMService
+
+        service = get_llm_service()
+        assert isinstance(service, CachingLLMService)
+
     def test_use_mocks_false_store_creates_neo4j_store(
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -311,6 +344,51 @@ class TestDependencyInjection:
         store = get_session_store()
         assert isinstance(store, Neo4jSessionStore)
 
+    def test_neo4j_store_follows_reinitialised_driver(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """After close_neo4j() + init_neo4j(), the store uses the new driver."""
+        from app.services import session_store
+
+        store = session_store.Neo4jSessionStore()
+        first, second = object(), object()
+        monkeypatch.setattr(session_store, "_driver", first)
+        assert store.driver is first
+        monkeypatch.setattr(session_store, "_driver", second)
+        assert store.driver is second
+        monkeypatch.setattr(session_store, "_driver", None)
+        with pytest.raises(StateStoreError):
+            store.driver
+
+    async def test_init_neo4j_failure_cancels_indexes_and_closes_driver(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A failed connectivity probe cancels index creation and closes the driver."""
+        from app.services import session_store
+
+        index_cancelled = asyncio.Event()
+
+        async def slow_indexes(_driver: object) -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                index_cancelled.set()
+                raise
+
+        driver = AsyncMock()
+        driver.verify_connectivity.side_effect = OSError("unreachable")
+        monkeypatch.setattr(session_store, "_driver", None)
+        monkeypatch.setattr(session_store, "_create_indexes", slow_indexes)
+        with patch.object(
+            session_store.AsyncGraphDatabase, "driver", return_value=driver
+        ):
+            with pytest.raises(StateStoreError, match="unreachable"):
+                await session_store.init_neo4j()
+
+        assert index_cancelled.is_set()
+        driver.close.assert_awaited_once()
+        assert session_store._driver is None
+
 
 # ═══════════════════════════════════════════════════════════
 #  5. End-to-End: generate_vendor_response with Mocks
@@ -325,27 +403,13 @@ class TestGenerateEndToEnd:
         self.llm = mock_llm
         self.store = mock_store
 
-    def _scene(self, **overrides: object) -> dict:
-        """Build a valid scene_context dict with optional overrides."""
-        base = {
-            "object_grabbed": "silk_scarf",
-            "happiness_score": 55,
-            "negotiation_state": "INQUIRY",
-            "input_language": "en-IN",
-            "target_language": "en-IN",
-        }
-        base.update(overrides)
-        return base
-
     async def test_greeting_flow(self) -> None:
-        from app.generate import generate_vendor_response
-
         # Pre-populate session with GREETING state (matches what create_session gives us)
         result = await generate_vendor_response(
             transcribed_text="Namaste bhaiya!",
             context_block="",
             rag_context="",
-            scene_context=self._scene(negotiation_state="GREETING"),
+            scene_context=make_scene(negotiation_state="GREETING"),
             session_id="test-greeting",
         )
         assert isinstance(result, dict)
@@ -355,8 +419,6 @@ class TestGenerateEndToEnd:
         assert len(result["reply_text"]) > 0
 
     async def test_haggling_flow(self) -> None:
-        from app.generate import generate_vendor_response
-
         # Pre-populate the session at INQUIRY so INQUIRY → HAGGLING is legal
         await self.store.create_session("test-haggling")
         await self.store.save_session("test-haggling", {
@@ -369,15 +431,13 @@ class TestGenerateEndToEnd:
             transcribed_text="Ye silk scarf kitne ka hai?",
             context_block="[Turn 1] User: Namaste",
             rag_context="Silk Scarf: Fair price 300-400",
-            scene_context=self._scene(),
+            scene_context=make_scene(),
             session_id="test-haggling",
         )
         assert result["negotiation_state"] == "INQUIRY"
         assert 0 <= result["happiness_score"] <= 100
 
     async def test_walkaway_flow(self) -> None:
-        from app.generate import generate_vendor_response
-
         # Pre-populate the session at HAGGLING so HAGGLING → WALKAWAY is legal
         await self.store.create_session("test-walkaway")
         await self.store.save_session("test-walkaway", {
@@ -390,15 +450,13 @@ class TestGenerateEndToEnd:
             transcribed_text="Nahi bhai, bahut mehnga hai",
             context_block="",
             rag_context="",
-            scene_context=self._scene(negotiation_state="HAGGLING"),
+            scene_context=make_scene(negotiation_state="HAGGLING"),
             session_id="test-walkaway",
         )
         assert result["negotiation_state"] == "WALKAWAY"
         assert result["vendor_mood"] in ("annoyed", "neutral")
 
     async def test_deal_flow(self) -> None:
-        from app.generate import generate_vendor_response
-
         # Pre-populate the session at HAGGLING so HAGGLING → DEAL is legal
         await self.store.create_session("test-deal")
         await self.store.save_session("test-deal", {
@@ -411,7 +469,7 @@ class TestGenerateEndToEnd:
             transcribed_text="Theek hai pakka deal!",
             context_block="",
             rag_context="",
-            scene_context=self._scene(negotiation_state="HAGGLING"),
+            scene_context=make_scene(negotiation_state="HAGGLING"),
             session_id="test-deal",
         )
         assert result["negotiation_state"] == "DEAL"
@@ -420,13 +478,11 @@ class TestGenerateEndToEnd:
         assert result["vendor_mood"] == "friendly"
 
     async def test_empty_input_flow(self) -> None:
-        from app.generate import generate_vendor_response
-
         result = await generate_vendor_response(
             transcribed_text="",
             context_block="",
             rag_context="",
-            scene_context=self._scene(),
+            scene_context=make_scene(),
             session_id="test-empty",
         )
         assert result["negotiation_state"] == "GREETING"
@@ -434,13 +490,11 @@ class TestGenerateEndToEnd:
 
     async def test_result_is_valid_vendor_response(self) -> None:
         """Result must be deserializable back to VendorResponse."""
-        from app.generate import generate_vendor_response
-
         result = await generate_vendor_response(
             transcribed_text="Hello vendor",
             context_block="",
             rag_context="",
-            scene_context=self._scene(negotiation_state="GREETING"),
+            scene_context=make_scene(negotiation_state="GREETING"),
             session_id="test-valid",
         )
         vr = VendorResponse.model_validate(result)
@@ -449,13 +503,11 @@ class TestGenerateEndToEnd:
 
     async def test_session_state_persisted(self) -> None:
         """After a call, session state should be saved in the store."""
-        from app.generate import generate_vendor_response
-
         await generate_vendor_response(
             transcribed_text="Namaste!",
             context_block="",
             rag_context="",
-            scene_context=self._scene(negotiation_state="GREETING"),
+            scene_context=make_scene(negotiation_state="GREETING"),
             session_id="persist-test",
         )
         state = await self.store.load_session("persist-test")
@@ -465,9 +517,7 @@ class TestGenerateEndToEnd:
 
     async def test_turn_count_increments(self) -> None:
         """Multiple calls should increment turn_count."""
-        from app.generate import generate_vendor_response
-
-        scene = self._scene(negotiation_state="GREETING")
+        scene = make_scene(negotiation_state="GREETING")
         for i in range(3):
             await generate_vendor_response(
                 transcribed_text="Namaste!",
@@ -482,13 +532,11 @@ class TestGenerateEndToEnd:
 
     async def test_empty_rag_context_works(self) -> None:
         """rag_context="" is a soft failure — function works fine."""
-        from app.generate import generate_vendor_response
-
         result = await generate_vendor_response(
             transcribed_text="Hello",
             context_block="some history",
             rag_context="",
-            scene_context=self._scene(negotiation_state="GREETING"),
+            scene_context=make_scene(negotiation_state="GREETING"),
             session_id="no-rag-test",
         )
         assert isinstance(result, dict)
@@ -496,13 +544,11 @@ class TestGenerateEndToEnd:
 
     async def test_response_has_all_expected_keys(self) -> None:
         """Contract: result dict must have all 7 keys."""
-        from app.generate import generate_vendor_response
-
         result = await generate_vendor_response(
             transcribed_text="test",
             context_block="",
             rag_context="",
-            scene_context=self._scene(),
+            scene_context=make_scene(),
             session_id="keys-test",
         )
         expected_keys = {
@@ -12,6 +12,8 @@ Coverage targets (rules.md §9.1):
     - LEGAL_TRANSITIONS: coverage of the transition graph
 """
 
+from typing import Any
+
 import pytest
 from pydantic import ValidationError
 
@@ -104,52 +106,34 @@ class TestLanguageCode:
 # ═══════════════════════════════════════════════════════════
 
 
-class TestLegalTransitions:
-    """Transition graph from rules.md §5.1."""
-
-    def test_greeting_to_inquiry(self) -> None:
-        assert NegotiationStage.INQUIRY in LEGAL_TRANSITIONS[NegotiationStage.GREETING]
-
-    def test_greeting_cannot_skip_to_haggling(self) -> None:
-        assert NegotiationStage.HAGGLING not in LEGAL_TRANSITIONS[NegotiationStage.GREETING]
-
-    def test_inquiry_to_haggling(self) -> None:
-        assert NegotiationStage.HAGGLING in LEGAL_TRANSITIONS[NegotiationStage.INQUIRY]
-
-    def test_inquiry_to_walkaway(self) -> None:
-        assert NegotiationStage.WALKAWAY in LEGAL_TRANSITIONS[NegotiationStage.INQUIRY]
+# Every legal (from, to) edge in rules.md §5.1 — nothing more, nothing less.
+_EXPECTED_EDGES: frozenset[tuple[NegotiationStage, NegotiationStage]] = frozenset({
+    (NegotiationStage.GREETING, NegotiationStage.INQUIRY),
+    (NegotiationStage.INQUIRY, NegotiationStage.HAGGLING),
+    (NegotiationStage.INQUIRY, NegotiationStage.WALKAWAY),
+    (NegotiationStage.HAGGLING, NegotiationStage.DEAL),
+    (NegotiationStage.HAGGLING, NegotiationStage.WALKAWAY),
+    (NegotiationStage.HAGGLING, NegotiationStage.CLOSURE),
+    # Allowed only if happiness_score > 40 — graph permits it, engine enforces
+    (NegotiationStage.WALKAWAY, NegotiationStage.HAGGLING),
+    (NegotiationStage.WALKAWAY, NegotiationStage.CLOSURE),
+})
 
-    def test_haggling_to_deal(self) -> None:
-        assert NegotiationStage.DEAL in LEGAL_TRANSITIONS[NegotiationStage.HAGGLING]
 
-    def test_haggling_to_walkaway(self) -> None:
-        assert NegotiationStage.WALKAWAY in LEGAL_TRANSITIONS[NegotiationStage.HAGGLING]
-
-    def test_haggling_to_closure(self) -> None:
-        assert NegotiationStage.CLOSURE in LEGAL_TRANSITIONS[NegotiationStage.HAGGLING]
-
-    def test_walkaway_to_haggling(self) -> None:
-        # Allowed only if vendor_happiness > 40 — graph permits it, engine enforces condition
-        assert NegotiationStage.HAGGLING in LEGAL_TRANSITIONS[NegotiationStage.WALKAWAY]
-
-    def test_walkaway_to_closure(self) -> None:
-        assert NegotiationStage.CLOSURE in LEGAL_TRANSITIONS[NegotiationStage.WALKAWAY]
-
-    def test_deal_is_terminal(self) -> None:
-        assert LEGAL_TRANSITIONS[NegotiationStage.DEAL] == set()
-        assert NegotiationStage.DEAL in TERMINAL_STAGES
-
-    def test_closure_is_terminal(self) -> None:
-        assert LEGAL_TRANSITIONS[NegotiationStage.CLOSURE] == set()
-        assert NegotiationStage.CLOSURE in TERMINAL_STAGES
+class TestLegalTransitions:
+    """Transition graph from rules.md §5.1."""
 
-    def test_no_backward_from_deal(self) -> None:
-        assert NegotiationStage.HAGGLING not in LEGAL_TRANSITIONS[NegotiationStage.DEAL]
+    def test_transition_graph(self) -> None:
+        """Exact edge set: catches missing edges and illegal extras alike."""
+        actual = frozenset(
+            (src, dst) for src, targets in LEGAL_TRANSITIONS.items() for dst in targets
+        )
+        assert actual == _EXPECTED_EDGES
 
-    def test_no_browsing_stage_in_transitions(self) -> None:
-        """BROWSING was removed — INQUIRY replaces it."""
-        for targets in LEGAL_TRANSITIONS.values():
-            assert NegotiationStage.INQUIRY is not None  # just verify it exists
+    def test_terminal_stages(self) -> None:
+        assert TERMINAL_STAGES == {NegotiationStage.DEAL, NegotiationStage.CLOSURE}
+        for stage in TERMINAL_STAGES:
+            assert LEGAL_TRANSITIONS[stage] == set()
 
     def test_all_stages_have_transition_entry(self) -> None:
         for stage in NegotiationStage:
@@ -305,6 +289,16 @@ class TestAIDecision:
 # ═══════════════════════════════════════════════════════════
 
 
+# One valid payload; each case below overrides a single field.
+_VENDOR_RESPONSE_BASE: dict[str, Any] = {
+    "reply_text": "Test",
+    "happiness_score": 50,
+    "negotiation_state": "INQUIRY",
+    "vendor_mood": "neutral",
+    "suggested_user_response": "How much is this?",
+}
+
+
 class TestVendorResponse:
     """VendorResponse — validated output dict returned to Dev B."""
 
@@ -333,96 +327,37 @@ class TestVendorResponse:
         assert d["negotiation_state"] == "HAGGLING"
         assert d["vendor_mood"] == "enthusiastic"
 
-    def test_all_stages_valid(self) -> None:
-        for stage in NegotiationStage:
-            r = VendorResponse(
-                reply_text="Test",
-                happiness_score=50,
-                negotiation_state=stage.value,
-                vendor_mood="neutral",
-                suggested_user_response="How much is this?",
-            )
-            assert r.negotiation_state == stage.value
-
-    def test_invalid_stage_raises(self) -> None:
-        with pytest.raises(ValidationError):
-            VendorResponse(
-                reply_text="Test",
-                happiness_score=50,
-                negotiation_state="WALK_AWAY",  # old v2.0 name
-                vendor_mood="neutral",
-                suggested_user_response="How much is this?",
-            )
-
-    def test_invalid_vendor_mood_raises(self) -> None:
-        with pytest.raises(ValidationError):
-            VendorResponse(
-                reply_text="Test",
-                happiness_score=50,
-                negotiation_state="INQUIRY",
-                vendor_mood="happy",
-                suggested_user_response="How much is this?",
-            )
-
-    def test_happiness_boundary_zero(self) -> None:
-        r = VendorResponse(
-            reply_text="Hmph",
-            happiness_score=0,
-            negotiation_state="CLOSURE",
-            vendor_mood="angry",
-            suggested_user_response="Goodbye.",
-        )
-        assert r.happiness_score == 0
-
-    def test_happiness_boundary_100(self) -> None:
-        r = VendorResponse(
-            reply_text="Wonderful!",
-            happiness_score=100,
-            negotiation_state="DEAL",
-            vendor_mood="enthusiastic",
-            suggested_user_response="Thank you!",
-        )
-        assert r.happiness_score == 100
-
-    def test_happiness_below_0_raises(self) -> None:
-        with pytest.raises(ValidationError):
-            VendorResponse(
-                reply_text="Test",
-                happiness_score=-1,
-                negotiation_state="INQUIRY",
-                vendor_mood="neutral",
-                suggested_user_response="How much?",
-            )
-
-    def test_happiness_above_100_raises(self) -> None:
+    @pytest.mark.parametrize("stage", list(NegotiationStage), ids=lambda s: s.value)
+    def test_all_stages_valid(self, stage: NegotiationStage) -> None:
+        data = {**_VENDOR_RESPONSE_BASE, "negotiation_state": stage.value}
+        r = VendorResponse(**data)
+        assert r.negotiation_state == stage.value
+
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            pytest.param("happiness_score", 0, id="happiness_boundary_zero"),
+            pytest.param("happiness_score", 100, id="happiness_boundary_100"),
+            pytest.param("vendor_mood", "friendly", id="friendly_mood"),
+        ],
+    )
+    def test_field_value_accepted(self, field: str, value: object) -> None:
+        r = VendorResponse(**{**_VENDOR_RESPONSE_BASE, field: value})
+        assert getattr(r, field) == value
+
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            pytest.param("negotiation_state", "WALK_AWAY", id="old_v2_stage_name"),
+            pytest.param("vendor_mood", "happy", id="unknown_vendor_mood"),
+            pytest.param("happiness_score", -1, id="happiness_below_0"),
+            pytest.param("happiness_score", 101, id="happiness_above_100"),
+            pytest.param("reply_text", "", id="empty_reply_text"),
+        ],
+    )
+    def test_invalid_field_raises(self, field: str, value: object) -> None:
         with pytest.raises(ValidationError):
-            VendorResponse(
-                reply_text="Test",
-                happiness_score=101,
-                negotiation_state="INQUIRY",
-                vendor_mood="neutral",
-                suggested_user_response="How much?",
-            )
-
-    def test_empty_reply_text_raises(self) -> None:
-        with pytest.raises(ValidationError):
-            VendorResponse(
-                reply_text="",
-                happiness_score=50,
-                negotiation_state="INQUIRY",
-                vendor_mood="neutral",
-                suggested_user_response="How much?",
-            )
-
-    def test_friendly_mood_accepted(self) -> None:
-        r = VendorResponse(
-            reply_text="Test",
-            happiness_score=70,
-            negotiation_state="INQUIRY",
-            vendor_mood="friendly",
-            suggested_user_response="How much is this?",
-        )
-        assert r.vendor_mood == "friendly"
+            VendorResponse(**{**_VENDOR_RESPONSE_BASE, field: value})
 
 
 # ═══════════════════════════════════════════════════════════
@@ -103,7 +103,6 @@ def session_id() -> str:
 class TestNeo4jConnection:
     """Verify the driver connects and handles lifecycle correctly."""
 
-    @pytest.mark.asyncio
     async def test_driver_connects(self, neo4j_driver) -> None:
         """Driver should be alive after init_neo4j()."""
         from app.services.session_store import get_driver
@@ -111,7 +110,6 @@ class TestNeo4jConnection:
         driver = get_driver()
         assert driver is not None
 
-    @pytest.mark.asyncio
     async def test_get_driver_without_init_raises(self) -> None:
         """get_driver() should raise if init_neo4j() was never called."""
         from app.services.session_store import _driver, get_driver
@@ -136,7 +134,6 @@ class TestNeo4jConnection:
 class TestSessionCRUD:
     """End-to-end CRUD: create, load, save, delete session nodes."""
 
-    @pytest.mark.asyncio
     async def test_create_session_creates_node(
         self, store: Neo4jSessionStore, session_id: str
     ) -> None:
@@ -156,7 +153,6 @@ class TestSessionCRUD:
         # Cleanup
         await store.delete_session(session_id)
 
-    @pytest.mark.asyncio
     async def test_create_session_idempotent(
         self, store: Neo4jSessionStore, session_id: str
     ) -> None:
@@ -170,7 +166,6 @@ class TestSessionCRUD:
         # Cleanup
         await store.delete_session(session_id)
 
-    @pytest.mark.asyncio
     async def test_load_session_returns_data(
         self, store: Neo4jSessionStore, session_id: str
     ) -> None:
@@ -185,7 +180,6 @@ class TestSessionCRUD:
         # Cleanup
         await store.delete_session(session_id)
 
-    @pytest.mark.asyncio
     async def test_load_session_not_found(
         self, store: Neo4jSessionStore
     ) -> None:
@@ -193,7 +187,6 @@ class TestSessionCRUD:
         result = await store.load_session("nonexistent-session-xyz")
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_save_session_updates_state(
         self, store: Neo4jSessionStore, session_id: str
     ) -> None:
@@ -222,7 +215,6 @@ class TestSessionCRUD:
         # Cleanup
         await store.delete_session(session_id)
 
-    @pytest.mark.asyncio
     async def test_save_session_upsert(
         self, store: Neo4jSessionStore, session_id: str
     ) -> None:
@@ -244,7 +236,6 @@ class TestSessionCRUD:
         # Cleanup
         await store.delete_session(session_id)
 
-    @pytest.mark.asyncio
     async def test_delete_session_removes_node(
         self, store: Neo4jSessionStore, session_id: str
     ) -> None:
@@ -256,7 +247,6 @@ class TestSessionCRUD:
         loaded = await store.load_session(session_id)
         assert loaded is None
 
-    @pytest.mark.asyncio
     async def test_delete_nonexistent_session(
         self, store: Neo4jSessionStore
     ) -> None:
@@ -273,7 +263,6 @@ class TestSessionCRUD:
 class TestMultiTurnProgression:
     """Simulate a full haggling session across multiple turns."""
 
-    @pytest.mark.asyncio
     async def test_full_negotiation_lifecycle(
         self, store: Neo4jSessionStore, session_id: str
     ) -> None:
@@ -344,7 +333,6 @@ class TestMultiTurnProgression:
 class TestDatabaseCleanup:
     """Test the delete_all_sessions cleanup utility."""
 
-    @pytest.mark.asyncio
     async def test_delete_all_sessions(
         self, store: Neo4jSessionStore
     ) -> None:
@@ -368,7 +356,6 @@ class TestDatabaseCleanup:
             loaded = await store.load_session(sid)
             assert loaded is None, f"Session {sid} should be deleted"
 
-    @pytest.mark.asyncio
     async def test_cleanup_leaves_empty_db(
         self, store: Neo4jSessionStore
     ) -> None:
@@ -16,18 +16,22 @@ import pytest
 from app.models.enums import (
     LEGAL_TRANSITIONS,
     MAX_MOOD_DELTA,
+    TERMINAL_STAGES,
     NegotiationStage,
     VendorMood,
 )
 from app.models.response import AIDecision
 from app.services.state_engine import (
+    SessionSnapshot,
     ValidatedState,
     build_session_summary,
     clamp_delta,
     derive_vendor_mood,
     is_terminal_state,
+    make_validator,
     validate_ai_decision,
     validate_transition,
+    validate_transitions_batch,
 )
 
 
@@ -171,6 +175,32 @@ class TestValidateTransition:
                         NegotiationStage.CLOSURE,
                     }
 
+    def test_batch_matches_scalar(self) -> None:
+        """Batch validation agrees with validate_transition on every input."""
+        triples = [
+            (current, target, happiness)
+            for current in NegotiationStage
+            for target in NegotiationStage
+            for happiness in (20, 40, 41, 80)
+        ]
+        currents, targets, scores = zip(*triples)
+        approved, overridden = validate_transitions_batch(
+            currents, targets, scores
+        )
+
+        for (current, target, happiness), stage, flag in zip(
+            triples, approved, overridden
+        ):
+            expected, warnings = validate_transition(current, target, happiness)
+            assert stage == expected
+            assert flag is bool(warnings)
+
+    def test_batch_length_mismatch(self) -> None:
+        with pytest.raises(ValueError):
+            validate_transitions_batch(
+                [NegotiationStage.GREETING], [], [50]
+            )
+
 
 # ═══════════════════════════════════════════════════════════
 #  5.2 — Mood / Sentiment Clamping Tests
@@ -238,11 +268,25 @@ class TestClampDelta:
         assert val == 60
         assert clamped is True
 
+    def test_out_of_range_current_stays_within_bounds(self) -> None:
+        """A current outside [0,100] (bad stored state) still yields a bounded value."""
+        assert clamp_delta(120, 50) == (100, True)
+        assert clamp_delta(-20, 90) == (0, True)
+        assert clamp_delta(120, 110) == (100, True)
+
     def test_same_value_no_clamp(self) -> None:
         val, clamped = clamp_delta(50, 50)
         assert val == 50
         assert clamped is False
 
+    @pytest.mark.parametrize("current", [0, 7, 50, 93, 100])
+    def test_in_range_proposals_pass_through(self, current: int) -> None:
+        """Any proposal within ±MAX_MOOD_DELTA and [0,100] is returned as-is."""
+        lo = max(0, current - MAX_MOOD_DELTA)
+        hi = min(100, current + MAX_MOOD_DELTA)
+        for proposed in range(lo, hi + 1):
+            assert clamp_delta(current, proposed) == (proposed, False)
+
 
 class TestDeriveVendorMood:
     """Test happiness → mood category mapping."""
@@ -270,6 +314,15 @@ class TestDeriveVendorMood:
     def test_mood_derivation(self, happiness: int, expected: VendorMood) -> None:
         assert derive_vendor_mood(happiness) == expected
 
+    @pytest.mark.parametrize(
+        "happiness,expected",
+        [(-5, VendorMood.ANGRY), (150, VendorMood.ENTHUSIASTIC)],
+    )
+    def test_out_of_range_scores_clamped(
+        self, happiness: int, expected: VendorMood
+    ) -> None:
+        assert derive_vendor_mood(happiness) == expected
+
 
 # ═══════════════════════════════════════════════════════════
 #  5.3 — Terminal State Detection
@@ -297,6 +350,12 @@ class TestTerminalState:
     def test_non_terminal(self, stage: NegotiationStage) -> None:
         assert is_terminal_state(stage) is False
 
+    @pytest.mark.parametrize("stage", list(NegotiationStage))
+    def test_member_flag_matches_terminal_stages(
+        self, stage: NegotiationStage
+    ) -> None:
+        assert stage.is_terminal is (stage in TERMINAL_STAGES)
+
     def test_session_summary_deal(self) -> None:
         summary = build_session_summary(
             session_id="test-123",
@@ -484,3 +543,33 @@ class TestValidateAIDecision:
 
         assert result.happiness_score == 55
         assert len(result.warnings) >= 1
+
+    def test_snapshot_matches_dict(self) -> None:
+        """A SessionSnapshot and the equivalent dict validate identically."""
+        decision = _make_decision(happiness_score=90)
+        state = _make_session_state(happiness_score=50)
+        from_dict = validate_ai_decision(decision, state)
+        from_snap = validate_ai_decision(
+            decision, SessionSnapshot.from_state(state)
+        )
+
+        assert from_snap == from_dict
+
+    def test_snapshot_defaults_for_missing_keys(self) -> None:
+        """Missing session keys fall back to the engine's defaults."""
+        snap = SessionSnapshot.from_state({})
+
+        assert snap.happiness_score == 50
+        assert snap.negotiation_state == "GREETING"
+        assert snap.session_id == "unknown"
+        assert snap.last_counter_price is None
+
+    def test_make_validator_binds_delta(self) -> None:
+        """make_validator pre-binds max_mood_delta and is cached per value."""
+        validator = make_validator(5)
+        assert make_validator(5) is validator
+
+        result = validator(
+            _make_decision(happiness_score=60), _make_session_state()
+        )
+        assert result.happiness_score == 55